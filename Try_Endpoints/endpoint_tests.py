@@ -469,7 +469,7 @@ feca744209047e57&ipo=images', timeout=5)
         log.critical("Failed to download the image")
 
     # Convert the binary content to base64
-    base64_image = base64.b64encode(file_content).decode('utf-8')
+    base64_image = base64.b64encode(file_content).decode('ascii')
 
     # Set payload
     payload = {
@@ -14,6 +14,7 @@ import time
 import requests
 
 import custom_exceptions
+import sessions
 
 # Set timeout for a 429
 MAX_RETRIES = 10
@@ -69,6 +70,9 @@ PLATE_URL = "https://api.verkada.com/cameras/v1/\
 analytics/lpr/license_plate_of_interest"
 PERSON_URL = "https://api.verkada.com/cameras/v1/people/person_of_interest"
 
+# Shared connection pool for the requests-based calls in this module
+SESSION = sessions.make_session(pool_maxsize=64, retry=False)
+
 
 ##############################################################################
                                 #  Misc  #
@@ -154,11 +158,13 @@ def run_thread_with_rate_limit(threads, rate_limit=5):
 
     def run_thread(thread):
         limiter.acquire()
-        log.debug(
-            "Starting thread %s at time %s",
-            thread.name,
-            datetime.datetime.now().strftime('%H:%M:%S')
-        )
+        # Only format the timestamp when debug output will actually be shown
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Starting thread %s at time %s",
+                thread.name,
+                datetime.datetime.now().strftime('%H:%M:%S')
+            )
         thread.start()
 
     for thread in threads:
@@ -198,9 +204,13 @@ def flash_led(pin, local_stop_event, speed):
     """
     while not local_stop_event.is_set():
         GPIO.output(pin, True)
-        time.sleep(speed)
+        # Wait on the event so a stop request is seen without a full cycle
+        if local_stop_event.wait(speed):
+            break
         GPIO.output(pin, False)
-        time.sleep(speed * 2)
+        local_stop_event.wait(speed * 2)
+
+    GPIO.output(pin, False)  # Never leave the LED lit after stopping
 
 
 ##############################################################################
@@ -228,7 +238,7 @@ def get_people(org_id=ORG_ID, api_key=API_KEY):
         "org_id": org_id,
     }
 
-    response = requests.get(
+    response = SESSION.get(
         PERSON_URL,
         headers=headers,
         params=params,
@@ -338,7 +348,7 @@ def delete_person(person, persons, org_id=ORG_ID, api_key=API_KEY):
 
     try:
         for _ in range(MAX_RETRIES):
-            response = requests.delete(
+            response = SESSION.delete(
                 PERSON_URL,
                 headers=headers,
                 params=params,
@@ -533,7 +543,7 @@ def get_plates(org_id=ORG_ID, api_key=API_KEY):
         "org_id": org_id,
     }
 
-    response = requests.get(
+    response = SESSION.get(
         PLATE_URL,
         headers=headers,
         params=params,
@@ -651,7 +661,7 @@ def delete_plate(plate, plates, org_id=ORG_ID, api_key=API_KEY):
 
     try:
         for _ in range(MAX_RETRIES):
-            response = requests.delete(
+            response = SESSION.delete(
                 PLATE_URL,
                 headers=headers,
                 params=params,
@@ -5,20 +5,26 @@ These names will be "persistent plates/persons" which are to remain in
 Command. Any person or plate not marked thusly will be deleted from the org.
 """
 # Import essential libraries
-import datetime
 import logging
 import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 
-import requests
+import urllib3
+from urllib3.util.retry import Retry
 
 import custom_exceptions
+import sessions
+
+# Cap how many deletions may be in flight at once
+MAX_WORKERS = 10
 
 # Set timeout for a 429
 MAX_RETRIES = 10
 DEFAULT_RETRY_DELAY = 0.25
-BACKOFF = 0.25
+MAX_RETRY_DELAY = 30
 
 # Set logger
 log = logging.getLogger()
@@ -58,13 +64,42 @@ except ImportError:
     log.debug("RPi.GPIO is not availbale. Running on a non-Pi platform")
 
 # Set the full name for which plates are to be persistent
-PERSISTENT_PLATES = sorted([])  # Label of plate #!Not plate number!#
-PERSISTENT_LID = sorted([])  # LPoI ID
+PERSISTENT_PLATES = ()  # Label of plate #!Not plate number!#
+PERSISTENT_LID = ()  # LPoI ID
 
 # Set API endpoint URLs
 PLATE_URL = "https://api.verkada.com/cameras/v1/\
 analytics/lpr/license_plate_of_interest"
 
+# Shared connection pool for the requests-based calls in this module
+SESSION = sessions.make_session(pool_maxsize=64, retry=False)
+
+# The delete fan-out only ever hits one fixed endpoint with the same headers,
+# so it talks to urllib3 directly and skips the per-request Session overhead.
+# One connection per worker, blocking instead of overflowing, means every TLS
+# handshake is paid once and then reused for the rest of the purge.
+POOL = urllib3.PoolManager(
+    num_pools=1,
+    maxsize=MAX_WORKERS,
+    block=True,
+    headers={
+        "accept": "application/json",
+        "x-api-key": API_KEY
+    },
+    # Back off exponentially with jitter, or for as long as the server asks
+    # via Retry-After, so throttled threads do not retry in lockstep
+    retries=Retry(
+        total=MAX_RETRIES,
+        backoff_factor=DEFAULT_RETRY_DELAY,
+        backoff_max=MAX_RETRY_DELAY,
+        backoff_jitter=DEFAULT_RETRY_DELAY,
+        status_forcelist=[429, 504],
+        allowed_methods=["DELETE"],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+)
+
 
 ##############################################################################
                                 #  Misc  #
@@ -137,46 +172,6 @@ class RateLimiter:
                 return True
 
 
-def run_thread_with_rate_limit(threads, rate_limit=10):
-    """
-    Run a thread with rate limiting.
-
-    :param target: The target function to be executed in the thread:
-    :type targe: function:
-    :return: The thread that was created and ran
-    :rtype: thread
-    """
-    limiter = RateLimiter(rate_limit=rate_limit)
-
-    def run_thread(thread):
-        limiter.acquire()
-        log.debug(
-            "Starting thread %s at time %s",
-            thread.name,
-            datetime.datetime.now().strftime('%H:%M:%S')
-        )
-        thread.start()
-
-    for thread in threads:
-        run_thread(thread)
-
-    for thread in threads:
-        thread.join()
-
-
-def clean_list(messy_list):
-    """
-    Removes any None values from error codes
-
-    :param list: The list to be cleaned.
-    :type list: list
-    :return: A new list with None values removed.
-    :rtype: list
-    """
-    cleaned_list = [value for value in messy_list if value is not None]
-    return cleaned_list
-
-
 def flash_led(pin, local_stop_event, speed):
     """
     Flashes an LED that is wired into the GPIO board of a raspberry pi for
@@ -194,9 +189,13 @@ def flash_led(pin, local_stop_event, speed):
     """
     while not local_stop_event.is_set():
         GPIO.output(pin, True)
-        time.sleep(speed)
+        # Wait on the event so a stop request is seen without a full cycle
+        if local_stop_event.wait(speed):
+            break
         GPIO.output(pin, False)
-        time.sleep(speed * 2)
+        local_stop_event.wait(speed * 2)
+
+    GPIO.output(pin, False)  # Never leave the LED lit after stopping
 
 
 ##############################################################################
@@ -224,7 +223,7 @@ def get_plates(org_id=ORG_ID, api_key=API_KEY):
         "org_id": org_id,
     }
 
-    response = requests.get(
+    response = SESSION.get(
         PLATE_URL,
         headers=headers,
         params=params,
@@ -253,31 +252,6 @@ def get_plates(org_id=ORG_ID, api_key=API_KEY):
         return
 
 
-def get_plate_ids(plates=None):
-    """
-    Returns an array of all LPoI labels in an organization.
-
-    :param plates: A list of dictionaries representing LPoIs in an
-    organization. Each dictionary should have 'license_plate' key. 
-    Defaults to None.
-    :type plates: list, optional
-    :return: A list of IDs of the LPoIs in an organization.
-    :rtype: list
-    """
-    plate_id = []
-
-    for plate in plates:
-        if plate.get('license_plate'):
-            plate_id.append(plate.get('license_plate'))
-        else:
-            log.error(
-                "Plate - There has been an error with plate %s.",
-                plate.get('label')
-            )
-
-    return plate_id
-
-
 def get_plate_id(plate=PERSISTENT_PLATES, plates=None):
     """
     Returns the Verkada ID for a given LPoI.
@@ -307,9 +281,10 @@ def get_plate_id(plate=PERSISTENT_PLATES, plates=None):
         return None
 
 
-def delete_plate(plate, plates, org_id=ORG_ID, api_key=API_KEY):
+def delete_plate(plate, plates, org_id=ORG_ID):
     """
-    Deletes the given plate from the organization.
+    Deletes the given plate from the organization. Authentication headers
+    are taken from POOL.
 
     :param plate: The plate to be deleted.
     :type plate: str
@@ -317,76 +292,56 @@ def delete_plate(plate, plates, org_id=ORG_ID, api_key=API_KEY):
     :type plates: list
     :param org_id: Organization ID. Defaults to ORG_ID.
     :type org_id: str, optional
-    :param api_key: API key for authentication. Defaults to API_KEY.
-    :type api_key: str, optional
     :return: None
     :rtype: None
     """
-    local_data = threading.local()
-    local_data.RETRY_DELAY = DEFAULT_RETRY_DELAY
-
-    headers = {
-        "accept": "application/json",
-        "x-api-key": api_key
-    }
-
     log.info(
         "Running for plate: %s",
         print_plate_name(plate, plates)
     )
 
-    params = {
-        'org_id': org_id,
-        'license_plate': plate
-    }
-
     try:
-        for _ in range(MAX_RETRIES):
-            response = requests.delete(
-                PLATE_URL,
-                headers=headers,
-                params=params,
-                timeout=5
-            )
-
-            if response.status_code == 429:
-                log.info(
-                    "%s response: 429. Retrying in %ss.",
-                    print_plate_name(plate, plates),
-                    local_data.RETRY_DELAY
-                )
-
-                time.sleep(local_data.RETRY_DELAY)
-
-                local_data.RETRY_DELAY += BACKOFF
-
-            else:
-                break
+        # Retries on 429/504 are handled by POOL
+        response = POOL.request(
+            "DELETE",
+            PLATE_URL,
+            # Pairs are URL-encoded as-is, no dict needs to be built per call
+            fields=(('org_id', org_id), ('license_plate', plate)),
+            timeout=5.0
+        )
 
-        if response.status_code == 429:
+        if response.status == 429:
             raise custom_exceptions.APIThrottleException("API throttled")
 
-        elif response.status_code == 504:
+        elif response.status == 504:
             log.warning(
                 "Plate - %s Timed out.",
                 print_plate_name(plate, plates)
             )
 
-        elif response.status_code == 400:
+        elif response.status == 400:
             log.warning("Plate - Contact support: endpoint failure")
 
-        elif response.status_code != 200:
+        elif response.status != 200:
             log.error(
                 "Plate - An error has occured. Status code %s",
-                response.status_code
+                response.status
             )
 
     except custom_exceptions.APIThrottleException:
         log.critical(
             "Plate - Hit API request rate limit of 500 requests per minute.")
 
+    # Connection errors and timeouts left over once POOL gives up retrying
+    except urllib3.exceptions.HTTPError as e:
+        log.error(
+            "Plate - %s could not be deleted: %s",
+            print_plate_name(plate, plates),
+            e
+        )
+
 
-def purge_plates(delete, plates, org_id=ORG_ID, api_key=API_KEY):
+def purge_plates(delete, plates, org_id=ORG_ID):
     """
     Purges all LPoIs that aren't marked as safe/persistent.
 
@@ -396,8 +351,6 @@ def purge_plates(delete, plates, org_id=ORG_ID, api_key=API_KEY):
     :type plates: list
     :param org_id: Organization ID. Defaults to ORG_ID.
     :type org_id: str, optional
-    :param api_key: API key for authentication. Defaults to API_KEY.
-    :type api_key: str, optional
     :return: Returns the value of 1 if completed successfully.
     :rtype: int
     """
@@ -416,15 +369,28 @@ def purge_plates(delete, plates, org_id=ORG_ID, api_key=API_KEY):
     log.info("Plate - Purging...")
 
     plate_start_time = time.time()
-    threads = []
-    for plate in delete:
-        # Toss delete function into a new thread
-        thread = threading.Thread(
-            target=delete_plate, args=(plate, plates, org_id, api_key,)
-        )
-        threads.append(thread)  # Add the thread to the pile
+    limiter = RateLimiter(rate_limit=10)
+
+    # Bind the arguments shared by every deletion once
+    delete_one = partial(delete_plate, plates=plates, org_id=org_id)
 
-    run_thread_with_rate_limit(threads)
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = []
+            for plate in delete:
+                limiter.acquire()  # Pace submissions under the API limit
+                futures.append(executor.submit(delete_one, plate))
+
+            # Collect in completion order so one slow delete does not hold
+            # up reporting on the rest
+            for future in as_completed(futures):
+                future.result()
+
+    finally:
+        # Always stop the LED, or its thread keeps the process alive
+        if GPIO and LPOI_PIN:
+            local_stop_event.set()
+            flash_thread.join()
 
     plate_end_time = time.time()
     plate_elapsed_time = plate_end_time - plate_start_time
@@ -432,10 +398,6 @@ def purge_plates(delete, plates, org_id=ORG_ID, api_key=API_KEY):
     log.info("Plate - Purge complete.")
     log.info("Plate - Time to complete: %.2f", plate_elapsed_time)
 
-    if GPIO and LPOI_PIN:
-        local_stop_event.set()
-        flash_thread.join()
-
     return 1  # Completed
 
 
@@ -476,27 +438,22 @@ def run_plates():
     plates = get_plates()
     log.info("Plates retrieved.")
 
-    # Sort the JSON dictionaries by plate id
-    plates = sorted(plates, key=lambda x: x['license_plate'])
-
     # Run if plates were found
     if plates:
         log.info("Plate - Gather IDs")
-        all_plate_ids = get_plate_ids(plates)
-        all_plate_ids = clean_list(all_plate_ids)
+        all_plate_ids = {
+            plate['license_plate'] for plate in plates
+            if plate.get('license_plate')
+        }
         log.info("Plate - IDs aquired.")
 
-        safe_plate_ids = []
-
         log.info("Searching for safe plates.")
-        # Create the list of safe plates
-        for plate in PERSISTENT_PLATES:
-            safe_plate_ids.append(get_plate_id(plate, plates))
-        safe_plate_ids = clean_list(safe_plate_ids)
-
-        if PERSISTENT_LID:
-            for plate in PERSISTENT_LID:
-                safe_plate_ids.append(plate)
+        # Create the set of safe plates
+        safe_plate_ids = {
+            get_plate_id(plate, plates) for plate in PERSISTENT_PLATES
+        }
+        safe_plate_ids.discard(None)  # Drop labels that were not found
+        safe_plate_ids.update(PERSISTENT_LID)
         log.info("Safe plates found.")
 
         # New list that filters plates that are safe
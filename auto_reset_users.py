@@ -10,9 +10,10 @@ import os
 import threading
 import time
 
-import requests
 from dotenv import load_dotenv
 
+import sessions
+
 load_dotenv()  # Load credentials file
 
 ORG_ID = os.getenv("")
@@ -39,6 +40,9 @@ PERSISTENT_USERS = sorted(["Ian Young", "Bruce Banner",
 USER_INFO_URL = "https://api.verkada.com/access/v1/access_users"
 USER_CONTROL_URL = "https://api.verkada.com/core/v1/user"
 
+# Shared connection pool for the requests-based calls in this module
+SESSION = sessions.make_session(pool_maxsize=64, retry=False)
+
 
 ##############################################################################
                                 #  Misc  #
@@ -136,7 +140,7 @@ def get_users(org_id=ORG_ID, api_key=API_KEY):
         "org_id": org_id,
     }
 
-    response = requests.get(
+    response = SESSION.get(
         USER_INFO_URL,
         headers=headers,
         params=params,
@@ -233,7 +237,7 @@ def delete_user(user, users, org_id=ORG_ID, api_key=API_KEY):
 
     log.info("Running for user: %s", print_name(user, users))
 
-    response = requests.delete(url, headers=headers, timeout=5)
+    response = SESSION.delete(url, headers=headers, timeout=5)
 
     if response.status_code != 200:
         log.error(
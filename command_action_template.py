@@ -8,10 +8,12 @@ import logging
 import time
 from os import getenv
 
+import orjson
 import requests
 from dotenv import load_dotenv
 
 import custom_exceptions
+import sessions
 
 load_dotenv()  # Load credentials file
 
@@ -73,7 +75,7 @@ def login_and_get_tokens(login_session, username, password, org_id):
         response.raise_for_status()
 
         # Extract relevant information from the JSON response
-        json_response = response.json()
+        json_response = orjson.loads(response.content)
         session_csrf_token = json_response.get("csrfToken")
         session_user_token = json_response.get("userToken")
         session_user_id = json_response.get("userId")
@@ -88,6 +90,7 @@ def login_and_get_tokens(login_session, username, password, org_id):
 def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     """
     Logs the Python script out of Command to prevent orphaned sessions.
+    The session itself is left open; it belongs to the caller.
 
     :param logout_session: The session to use when authenticating.
     :type logout_session: requests.Session
@@ -118,9 +121,6 @@ def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     except requests.exceptions.RequestException as e:
         raise custom_exceptions.APIExceptionHandler(e, response, "Logout")
 
-    finally:
-        logout_session.close()
-
 
 ##############################################################################
                             #   Requests   #
@@ -179,7 +179,7 @@ def command_action(action_session, x_verkada_token, x_verkada_auth,
 # Check if the script is being imported or ran directly
 if __name__ == "__main__":
 
-    with requests.Session() as session:
+    with sessions.make_session() as session:
         start_run_time = time.time()  # Start timing the script
         try:
             # Initialize the user session.
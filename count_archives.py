@@ -10,10 +10,12 @@ import logging
 import time
 from os import getenv
 
+import orjson
 import requests
 from dotenv import load_dotenv
 
 import custom_exceptions
+import sessions
 
 load_dotenv()  # Load credentials file
 
@@ -67,7 +69,7 @@ def login_and_get_tokens(login_session, username, password, org_id):
         response.raise_for_status()
 
         # Extract relevant information from the JSON response
-        json_response = response.json()
+        json_response = orjson.loads(response.content)
         session_csrf_token = json_response.get("csrfToken")
         session_user_token = json_response.get("userToken")
         session_user_id = json_response.get("userId")
@@ -82,6 +84,7 @@ def login_and_get_tokens(login_session, username, password, org_id):
 def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     """
     Logs the Python script out of Command to prevent orphaned sessions.
+    The session itself is left open; it belongs to the caller.
 
     :param x_verkada_token: The csrf token for a valid, authenticated session.
     :type x_verkada_token: str
@@ -110,9 +113,6 @@ def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     except requests.exceptions.RequestException as e:
         raise custom_exceptions.APIExceptionHandler(e, response, "Logout")
 
-    finally:
-        logout_session.close()
-
 
 def read_verkada_camera_archives(archive_session, x_verkada_token,
                                  x_verkada_auth, usr, org_id=ORG_ID):
@@ -178,7 +178,7 @@ if __name__ == "__main__":
         start_time = time.time()
 
         # Start the user session
-        with requests.Session() as session:
+        with sessions.make_session() as session:
             csrf_token, user_token, user_id = login_and_get_tokens(
                 session,
                 USERNAME,
@@ -50,7 +50,7 @@ needs to be downloaded.
         file_content = image  # No need to parse the file
 
     # Convert the binary content to base64
-    base64_image = base64.b64encode(file_content).decode('utf-8')
+    base64_image = base64.b64encode(file_content).decode('ascii')
 
     # Set payload
     payload = {
@@ -7,12 +7,14 @@ import logging
 import base64
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from os import getenv
 
 import colorama
 import requests
 from colorama import Fore, Style
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 colorama.init(autoreset=True)
 
@@ -35,6 +37,13 @@ API_KEY = getenv("")
 ORG_ID = getenv("")
 IMAGE_PATH = "/Users/ian.young/Pictures/thispersondoesnotexist2.jpg"
 
+MAX_WORKERS = 8  # Uploads allowed in flight at once
+
+# One pooled session for every upload so the workers reuse open TLS
+# connections instead of negotiating a new one per PoI
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_maxsize=MAX_WORKERS))
+
 # Each file name must be on a new line. File name format is expected to be
 # the student's name then .jpg or whatever the format is. The file MUST be
 # in the same directory of the script.
@@ -144,7 +153,7 @@ def create_poi(
         log.debug("%sEncoding file...", Fore.LIGHTCYAN_EX)
 
         # Convert the binary content to base64
-        base64_image = base64.b64encode(file_content).decode('utf-8')
+        base64_image = base64.b64encode(file_content).decode('ascii')
         log.debug("%sFile encoded!", Fore.LIGHTGREEN_EX)
 
         log.debug("%sCalling API endpoint...", Fore.LIGHTCYAN_EX)
@@ -168,7 +177,7 @@ def create_poi(
             time.sleep(1)
             manager.reset_call_count()
 
-        response = requests.post(
+        response = SESSION.post(
             URL, json=payload, headers=headers, params=params, timeout=5
         )
 
@@ -197,30 +206,34 @@ def create_poi(
 
 # Check if the code is being ran directly or imported
 if __name__ == "__main__":
-    threads = []
+    futures = []
     purge_manager = PurgeManager(call_count_limit=300)
 
     try:
         log.debug("%sReading file...", Fore.LIGHTCYAN_EX)
-        file = open(PATH_LIST, 'r', encoding="utf-8")
-        lines = file.readlines()
-
-        for line in lines:
-            log.debug("%s %s", {line.split('.')[0]}, {line.strip()})
-            new_thread = threading.Thread(
-                target=create_poi,
-                args=(
-                    purge_manager,
-                    line.split('.')[0],
-                    line.strip(),
-                )
-            )
-
-            threads.append(new_thread)
-            new_thread.start()
-
-        for thread in threads:
-            thread.join()
+        # A bounded pool instead of one thread per line keeps large lists
+        # from opening more connections than the session can reuse
+        with open(PATH_LIST, 'r', encoding="utf-8") as file, \
+                ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Read lazily so uploads start before the whole list is read
+            for line in file:
+                # Split each entry once: the file name is the path, and
+                # everything before the first dot is the PoI label
+                image_path = line.strip()
+                if not image_path:
+                    continue  # Skip blank lines
+
+                label = image_path.partition('.')[0]
+                log.debug("%s %s", label, image_path)
+                futures.append(executor.submit(
+                    create_poi, purge_manager, label, image_path))
+
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except requests.exceptions.RequestException as e:
+                    log.error("%sUpload failed:%s %s",
+                              Fore.RED, Style.RESET_ALL, e)
 
     except FileNotFoundError:
         print(f"{Fore.RED}File {PATH_LIST} not found.")
@@ -7,12 +7,15 @@ import base64
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from os import getenv
 
+import orjson
 import requests
 from dotenv import load_dotenv
-
-from custom_exceptions import APIThrottleException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv()  # Load credentials file
 
@@ -46,62 +49,144 @@ PARAMS = {
     "org_id": ORG_ID
 }
 
+MAX_WORKERS = 16  # Concurrent API calls; kept below the session pool size
+
+# One pooled API session shared by every worker thread so TCP and TLS
+# handshakes are reused instead of repeated for each request
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=5,
+            read=0,  # Never replay a create the server may have accepted
+            backoff_factor=0.5,
+            status_forcelist=(429, 503),
+            allowed_methods=("POST", "GET"),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+    )
+)
+# Every API call carries the same headers and org, attach them once
+SESSION.headers.update(HEADERS)
+SESSION.params = PARAMS
+
+# Image downloads go to third-party hosts and must not carry the API key
+IMAGE_SESSION = requests.Session()
+
 
 ##############################################################################
                             #  Misc  #
 ##############################################################################
 
 
-class PurgeManager:
+class RateLimiter:
     """
-    Manages the state of API call count and provides thread-safe methods
-    to control and monitor the call limit.
-
-    Attributes:
-        call_count (int): The current number of API calls made.
-        call_count_lock (threading.Lock): A lock to ensure thread-safe access to call_count.
-        call_count_limit (int): The maximum number of API calls allowed.
+    Token-bucket limiter shared by every worker thread. Each API call takes
+    a permit and a daemon thread hands one back every period/limit seconds,
+    so callers only block once the bucket is actually empty.
     """
 
-    def __init__(self, call_count_limit=300):
+    def __init__(self, call_count_limit=500, period=60):
         """
-        Initializes the PurgeManager with a specified call count limit.
-
-        Args:
-            call_count_limit (int): The maximum number of API calls allowed.
-                                    Defaults to 300.
+        Initilization of the rate limiter.
+
+        :param call_count_limit: The maximum number of API calls allowed in
+        the given period.
+        :type call_count_limit: int, optional
+        :param period: The length of the window in seconds.
+        :type period: int, optional
+        :return: None
+        :rtype: None
         """
-        self.call_count = 0
-        self.call_count_lock = threading.Lock()
-        self.call_count_limit = call_count_limit
+        self.permits = threading.BoundedSemaphore(call_count_limit)
+        self.interval = period / call_count_limit
+        self.stop_event = threading.Event()
+
+        refill_thread = threading.Thread(target=self._refill, daemon=True)
+        refill_thread.start()
 
-    def increment_call_count(self):
+    def _refill(self):
         """
-        Increments the call count by one in a thread-safe manner.
+        Returns one permit to the bucket every interval until stopped. A full
+        bucket simply ignores the extra permit.
 
-        Returns:
-            int: The updated call count after incrementing.
+        :return: None
+        :rtype: None
         """
-        with self.call_count_lock:
-            self.call_count += 1
-            return self.call_count
+        while not self.stop_event.wait(self.interval):
+            try:
+                self.permits.release()
+            except ValueError:
+                pass  # Bucket is already full
 
-    def should_stop(self):
+    def acquire(self):
         """
-        Checks if the current call count has reached or exceeded the limit.
+        Blocks until a permit is available to make an API call.
 
-        Returns:
-            bool: True if the call count has reached or exceeded the limit, False otherwise.
+        :return: None
+        :rtype: None
         """
-        with self.call_count_lock:
-            return self.call_count >= self.call_count_limit
+        self.permits.acquire()
 
-    def reset_call_count(self):
+    def stop(self):
         """
-        Resets the call count to zero in a thread-safe manner.
+        Stops the refill thread.
+
+        :return: None
+        :rtype: None
         """
-        with self.call_count_lock:
-            self.call_count = 0
+        self.stop_event.set()
+
+
+def download_image(image_url):
+    """
+    Streams an image into a single preallocated buffer so the body is never
+    held twice while it is being read.
+
+    :param image_url: The URL of the image to download.
+    :type image_url: str
+    :return: A view of the downloaded bytes, or None if the download failed.
+    :rtype: memoryview
+    """
+    with IMAGE_SESSION.get(image_url, stream=True, timeout=5) as img_response:
+        if img_response.status_code != 200:
+            return None
+
+        buffer = bytearray(int(img_response.headers.get("Content-Length", 0)))
+        view = memoryview(buffer)
+        offset = 0
+
+        for chunk in img_response.iter_content(65536):
+            end = offset + len(chunk)
+            if end > len(buffer):
+                # Missing or short Content-Length, grow the buffer instead
+                view.release()
+                buffer[offset:] = chunk
+                view = memoryview(buffer)
+            else:
+                view[offset:end] = chunk
+            offset = end
+
+        return view[:offset]
+
+
+@lru_cache(maxsize=1)
+def encode_image_field(poi_image_b64):
+    """
+    Serializes the shared image into the JSON fragment
+    '"base64_image":"..."' once, so every PoI reusing it only pays for its
+    own label.
+
+    :param poi_image_b64: A base64-encoded image.
+    :type poi_image_b64: str
+    :return: The encoded key/value pair without the surrounding braces.
+    :rtype: bytes
+    """
+    return orjson.dumps({"base64_image": poi_image_b64})[1:-1]
 
 
 def clean_list(messy_list):
@@ -123,7 +208,7 @@ def clean_list(messy_list):
 ##############################################################################
 
 
-def create_poi(poi_name, poi_image, download, manager):
+def create_poi(poi_name, poi_image, download, limiter, poi_image_b64=None):
     """Will create a person of interest with a given URL to an image or path
     to a file
     
@@ -131,60 +216,54 @@ def create_poi(poi_name, poi_image, download, manager):
     :type name: str
     :param image: The image url to download and use.
     :type image: str
-    :param download: Determines whether or not a download is required. Expects
-    'y' or 'n'
-    :type download: str
-    :param manager: The API Throttle manager to prevent hitting the API limit.
-    :type manager: PurgeManager
+    :param download: Determines whether or not a download is required.
+    :type download: bool
+    :param limiter: The rate limiter to prevent hitting the API limit.
+    :type limiter: RateLimiter
+    :param poi_image_b64: An already base64-encoded image. When given, the
+    download and encode steps are skipped entirely.
+    :type poi_image_b64: str, optional
     """
-    file_content = None  # Pre-define
-
-    while manager.should_stop():
-        log.info("Call limit reached., waiting 1 second.")
-        time.sleep(1)
-        manager.reset_call_count()
-
-    if download == 'y':
-        # Download the JPG file from the URL
-        img_response = requests.get(poi_image, timeout=5)
-
-        if img_response.status_code == 200:
-            # File was successfully downloaded
-            file_content = img_response.content
-        else:
-            # Handle the case where the file download failed
-            log.critical("Failed to download the image")
+    if poi_image_b64 is not None:
+        # Shared, pre-encoded image; only the label needs serializing
+        body = b'{"label":%s,%s}' % (
+            orjson.dumps(poi_name), encode_image_field(poi_image_b64))
     else:
-        file_content = poi_image  # No need to parse the file
-
-    # Convert the binary content to base64
-    base64_image = base64.b64encode(file_content).decode('utf-8')
-
-    # Set payload
-    payload = {
-        "label": poi_name,
-        "base64_image": base64_image
-    }
-
-    try:
-        response = requests.post(
-            URL_POI, json=payload, headers=HEADERS, params=PARAMS, timeout=5)
-
-        if response.status_code == 429:
-            raise APIThrottleException("API throttled")
-
-        elif response.status_code != 200:
-            log.warning(
-                "%s: Could not create %s.",
-                response.status_code,
-                poi_name
-            )
-
-    except APIThrottleException:
-        log.critical("Hit API request rate limit of 500/min")
+        if download:
+            # Download the JPG file from the URL
+            file_content = download_image(poi_image)
+
+            if file_content is None:
+                # Nothing to upload, don't spend an API call on it
+                log.error("Skipping %s: failed to download the image.",
+                          poi_name)
+                return
+        else:
+            file_content = poi_image  # No need to parse the file
+
+        # Convert the binary content to base64
+        base64_image = base64.b64encode(file_content).decode('ascii')
+
+        # Set payload
+        body = orjson.dumps({
+            "label": poi_name,
+            "base64_image": base64_image
+        })
+
+    # Throttled (429) calls are retried by the session, honouring Retry-After
+    limiter.acquire()
+    response = SESSION.post(
+        URL_POI, data=body, timeout=5)
+
+    if response.status_code != 200:
+        log.warning(
+            "%s: Could not create %s.",
+            response.status_code,
+            poi_name
+        )
 
 
-def create_plate(lpoi_name, plate_number, manager):
+def create_plate(lpoi_name, plate_number, limiter):
     """
     Create a LPoI with a given name and plate
     
@@ -192,35 +271,26 @@ def create_plate(lpoi_name, plate_number, manager):
     :type plate_name: str
     :param plate_number: The value found on the license plate itself.
     :type plate_number: str
-    :param manager: The API Throttle manager to prevent hitting the API limit.
-    :type manager: PurgeManager
+    :param limiter: The rate limiter to prevent hitting the API limit.
+    :type limiter: RateLimiter
     """
     payload = {
         "description": lpoi_name,
         "license_plate": plate_number
     }
 
-    while manager.should_stop():
-        log.info("Call limit reached, waiting for 1 second.")
-        time.sleep(1)
-        manager.reset_call_count()
-
-    try:
-        response = requests.post(
-            URL_LPR, json=payload, headers=HEADERS, params=PARAMS, timeout=5)
+    # Throttled (429) calls are retried by the session, honouring Retry-After
+    limiter.acquire()
+    response = SESSION.post(
+        URL_LPR, data=orjson.dumps(payload), timeout=5)
 
-        if response.status_code == 429:
-            raise APIThrottleException("API throttled")
-        elif response.status_code != 200:
-            log.warning(
-                "%s Could not create %s.",
-                response.status_code,
-                lpoi_name
-            )
-            log.warning("Response content: %s", response.status_code)
-
-    except APIThrottleException:
-        log.critical("Hit API request rate limit of 500/min")
+    if response.status_code != 200:
+        log.warning(
+            "%s Could not create %s.",
+            response.status_code,
+            lpoi_name
+        )
+        log.debug("Response content: %s", response.text[:256])
 
 
 # Check if the code is being ran directly or imported
@@ -229,29 +299,41 @@ if __name__ == "__main__":
 pinimg.com%2F736x%2F87%2Fea%2F33%2F87ea336233db8ad468405db8f94da050--human-\
 faces-photos-of.jpg&f=1&nofb=1&ipt=6af7ecf6cd0e15496e7197f3b6cb1527beaa8718\
 c58609d4feca744209047e57&ipo=images'
-    purge_manager = PurgeManager(call_count_limit=300)
+    rate_limiter = RateLimiter(call_count_limit=500, period=60)
 
     start_time = time.time()
-    threads = []
-    for i in range(1, 11):
-        name = f'PoI{i}'
-        plate = f'PLATE{i}'
-        plate_name = f'Plate{i}'
-
-        log.info("Running for %s & %s", name, plate_name)
-        thread_poi = threading.Thread(
-            target=create_poi, args=(name, IMAGE, 'y', purge_manager,)
-        )
-        thread_poi.start()
-        threads.append(thread_poi)
-
-        thread_lpoi = threading.Thread(
-            target=create_plate, args=(plate_name, plate, purge_manager,)
-        )
-        thread_lpoi.start()
 
-    for thread in threads:
-        thread.join()
+    # Every PoI uses the same picture, so fetch and encode it only once
+    image_content = download_image(IMAGE)
+    if image_content is not None:
+        IMAGE_B64 = base64.b64encode(image_content).decode('ascii')
+    else:
+        # Each PoI will retry the download itself and skip on failure
+        log.critical("Failed to download the image")
+        IMAGE_B64 = None
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = []
+        for i in range(1, 11):
+            name = f'PoI{i}'
+            plate = f'PLATE{i}'
+            plate_name = f'Plate{i}'
+
+            log.info("Running for %s & %s", name, plate_name)
+            futures.append(executor.submit(
+                create_poi, name, IMAGE, True, rate_limiter, IMAGE_B64))
+            futures.append(executor.submit(
+                create_plate, plate_name, plate, rate_limiter))
+
+        # Wait on every call, PoI and LPoI alike, and report worker errors
+        # without stopping the rest of the run
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except requests.exceptions.RequestException as e:
+                log.error("Creation failed: %s", e)
+
+    rate_limiter.stop()
 
     end_time = time.time()
     elapsed_time = end_time - start_time
@@ -7,19 +7,19 @@ once made.
 """
 # Import essential libraries
 import logging
-import threading
 import time
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from os import getenv
 
 import colorama
-import pytz
+import numpy as np
+import orjson
 import requests
 from colorama import Fore, Style
 from dotenv import load_dotenv
-from tzlocal import get_localzone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-import avl_tree  # File to work with trees
 import custom_exceptions  # Import custom exceptions to save space
 
 colorama.init(autoreset=True)  # Initialize colorized output
@@ -37,11 +37,12 @@ ARCHIVE_URL = "https://vsubmit.command.verkada.com/library/export/list"
 DELETE_URL = "https://vsubmit.command.verkada.com/library/export/delete"
 LOGOUT_URL = "https://vprovision.command.verkada.com/user/logout"
 
-# Set up the logger
+# Set up the logger, verbose output is opt-in by setting DEBUG
+LOG_LEVEL = logging.DEBUG if getenv("DEBUG") else logging.INFO
 log = logging.getLogger()
-log.setLevel(logging.DEBUG)
+log.setLevel(LOG_LEVEL)
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=LOG_LEVEL,
     format="%(levelname)s: %(message)s"
 )
 
@@ -69,15 +70,10 @@ d7a77639-e451-4d35-b18f-8fd8ae2cd0a6",
 d7a77639-e451-4d35-b18f-8fd8ae2cd0a6"
 ]
 
-log.info("Building search tree.")
-AVL_TREE = avl_tree.build_avl_tree(PERSISTENT_ARCHIVES)
-log.info(
-    "%sSearch tree built.%s",
-    Fore.GREEN,
-    Style.RESET_ALL
-)
+PERSISTENT_SET = frozenset(PERSISTENT_ARCHIVES)  # O(1) membership checks
 
 AGE_LIMIT = 14  # Delete anything older than 14 days
+MAX_WORKERS = 20  # Concurrent deletes, one pooled connection each
 
 
 def login_and_get_tokens(login_session, username=USERNAME, password=PASSWORD, org_id=ORG_ID):
@@ -107,13 +103,17 @@ def login_and_get_tokens(login_session, username=USERNAME, password=PASSWORD, or
     try:
         # Request the user session
         log.debug("Requesting session.")
-        response = login_session.post(LOGIN_URL, json=login_data)
+        response = login_session.post(
+            LOGIN_URL,
+            data=orjson.dumps(login_data),
+            headers={"Content-Type": "application/json"}
+        )
         response.raise_for_status()
         log.debug("Session opened.")
 
         # Extract relevant information from the JSON response
         log.debug("Parsing JSON response.")
-        json_response = response.json()
+        json_response = orjson.loads(response.content)
         session_csrf_token = json_response.get("csrfToken")
         session_user_token = json_response.get("userToken")
         session_user_id = json_response.get("userId")
@@ -143,14 +143,16 @@ def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     headers = {
         "X-CSRF-Token": x_verkada_token,
         "X-Verkada-Auth": x_verkada_auth,
-        "x-verkada-orginization": org_id
+        "x-verkada-orginization": org_id,
+        "Content-Type": "application/json"
     }
 
     body = {
         "logoutCurrentEmailOnly": True
     }
     try:
-        response = logout_session.post(LOGOUT_URL, headers=headers, json=body)
+        response = logout_session.post(
+            LOGOUT_URL, headers=headers, data=orjson.dumps(body))
         response.raise_for_status()
 
         log.info("Logging out.")
@@ -163,13 +165,14 @@ def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
         logout_session.close()
 
 
-def read_verkada_camera_archives(archive_session, x_verkada_token,
-                                 x_verkada_auth, usr, org_id=ORG_ID):
+def authenticate_session(auth_session, x_verkada_token, x_verkada_auth, usr):
     """
-    Iterates through all Verkada archives that are visible to a given user.
+    Attaches the Command credentials to the session once so that every
+    archive request sent through it is authenticated without rebuilding its
+    headers.
 
-    :param archive_session: The session to use when authenticating.
-    :type archive_session: requests.Session
+    :param auth_session: The session to authenticate.
+    :type auth_session: requests.Session
     :param x_verkada_token: The csrf token for a valid, authenticated session.
     :type x_verkada_token: str
     :param x_verkada_auth: The authenticated user token for a valid Verkada
@@ -177,6 +180,24 @@ def read_verkada_camera_archives(archive_session, x_verkada_token,
     :type x_verkada_auth: str
     :param usr: The user ID for a valid user in the Verkad organization.
     :type usr: str
+    :return: None
+    :rtype: None
+    """
+    auth_session.headers.update({
+        "X-CSRF-Token": x_verkada_token,
+        "X-Verkada-Auth": x_verkada_auth,
+        "User": usr,
+        "Content-Type": "application/json"
+    })
+
+
+def read_verkada_camera_archives(archive_session, org_id=ORG_ID):
+    """
+    Iterates through all Verkada archives that are visible to a given user.
+
+    :param archive_session: An authenticated session, see
+    authenticate_session.
+    :type archive_session: requests.Session
     :param org_id: The organization ID for the targeted Verkada org.
     :type org_id: str, optional
     :return: An array of archived video export IDs.
@@ -189,21 +210,14 @@ def read_verkada_camera_archives(archive_session, x_verkada_token,
         "organizationId": org_id
     }
 
-    headers = {
-        "X-CSRF-Token": x_verkada_token,
-        "X-Verkada-Auth": x_verkada_auth,
-        "User": usr
-    }
-
     try:
         # Request the JSON archive library
         log.debug("Requesting archives.")
-        response = archive_session.post(
-            ARCHIVE_URL, json=body, headers=headers)
+        response = archive_session.post(ARCHIVE_URL, data=orjson.dumps(body))
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Archive IDs retrieved. Returning values.")
 
-        return response.json().get("videoExports", [])
+        return orjson.loads(response.content).get("videoExports", [])
 
     # Handle exceptions
     except requests.exceptions.RequestException as e:
@@ -211,12 +225,12 @@ def read_verkada_camera_archives(archive_session, x_verkada_token,
             e, response, "Read archives")
 
 
-def check_archive_timestamp(archive_library, x_verkada_token, x_verkada_auth,
-                            usr, age_limit=AGE_LIMIT):
+def check_archive_timestamp(archive_library, age_limit=AGE_LIMIT):
     """
-    Will iterate through the archive library and call a delete for any clip
+    Will iterate through the archive library and yield for deletion any clip
     that is older than the given time limit. If the time limit is set to '0'
-    then this function is skipped completely.
+    then every archive is yielded without checking its age. Archives marked
+    as persistent are never yielded.
 
     :param archive_library: The JSON formatted list of all visible archives in
     a Verkada organization.
@@ -224,145 +238,75 @@ def check_archive_timestamp(archive_library, x_verkada_token, x_verkada_auth,
     :param age_limit: The age limit set in days for the oldest archive to be
     kept if it is not found in the persistent list.
     :type age_limit: int
-    :return: A list of threads with individual archives to delete from 
-    Verkada Command.
-    :rtype: list
+    :return: A generator of (video export ID, archive name) pairs to delete
+    from Verkada Command, yielded one at a time once the age check has
+    run over the whole library.
+    :rtype: generator
     """
-    threads = []  # An array to be filled with threads with archives to delete
-    video_export_id, archive_name, result_node = '', '', None  # Initialize
-
-    log.debug("Getting local timezone.")
-    local_timezone = get_localzone()  # Load the local timezone for the device
-    log.debug("Timezone received.")
+    # Anything exported before this epoch second is past the age limit
+    cutoff_epoch = int(time.time()) - age_limit * 86400
+    log.debug("Deleting archives exported before epoch %d.", cutoff_epoch)
 
     if archive_library:
-        log.debug("----------------------")  # Aesthetic dividing line
-        for archive in archive_library:
-            # Get the name of the archive
-            if archive.get('label') != '':
-                archive_name = archive.get('label')
+        # Filter every export time in one vectorized comparison so only the
+        # expired archives are visited in Python. A zero limit takes all.
+        if age_limit == 0:
+            log.debug("Age limit set to zero. Skipping age check.")
+            expired = range(len(archive_library))
+        else:
+            timestamps = np.fromiter(
+                (archive.get("timeExported") or 0
+                 for archive in archive_library),
+                dtype=np.int64,
+                count=len(archive_library)
+            )
+            expired = np.flatnonzero(
+                (timestamps > 0) & (timestamps < cutoff_epoch))
+        log.debug(
+            "%d archives are older than %d days.", len(expired), age_limit)
 
-            elif archive.get('tags') != []:
-                archive_name = archive.get('tags')
+        # Checked once; per-archive debug output is skipped entirely at INFO
+        verbose = log.isEnabledFor(logging.DEBUG)
 
-            else:
-                archive_name = archive.get('videoExportId')
+        log.debug("----------------------")  # Aesthetic dividing line
+        for index in expired:
+            archive = archive_library[index]
+            video_export_id = archive.get("videoExportId")
 
-            # Get the time of the archived clip
-            epoch_timestamp = archive.get("timeExported")
-            log.debug(
-                "Retrieved archive epoch timestamp: %d",
-                epoch_timestamp
-            )
+            # Get the name of the archive
+            archive_name = (archive.get('label') or archive.get('tags')
+                            or video_export_id)
 
-            if epoch_timestamp:
-                # Take the epoch time and convert it to the local timezone
-                date_utc = datetime.fromtimestamp(epoch_timestamp,
-                                                  timezone.utc)
-                date_utc = pytz.utc.localize(date_utc)
-                date_local = date_utc.astimezone(local_timezone)
-
-                # Localize timestamp from Epoch to local timezone
-                log.debug("Localized archive time to %s", str(local_timezone))
-                date = date_local.strftime("%b %d, %Y %H:%M")  # Make string
-                log.debug("Exported time: %s", str(date))
-
-                # Change String object to datetime object to run comparisons
-                archive_time = datetime.strptime(date, "%b %d, %Y %H:%M")
-                log.debug("Converted to datetime object. Comparing times.")
-
-                # Get the time difference
-                current_time = datetime.now()
-                time_difference = current_time - archive_time
-                log.debug("Time difference: %s", str(time_difference))
-
-                # If the clip is older than the age limit, run in thread
-                if time_difference > timedelta(days=age_limit):
-                    video_export_id = archive.get("videoExportId")
-                    log.debug(
-                        "%s%s%s is older than %d days.",
-                        Fore.MAGENTA,
-                        archive_name,
-                        Style.RESET_ALL,
-                        age_limit
-                    )
+            if video_export_id not in PERSISTENT_SET:
+                if verbose:
                     log.debug(
-                        "Checking if %s%s%s is persistent.",
+                        "Marking %s%s%s for deletion.",
                         Fore.MAGENTA,
                         archive_name,
                         Style.RESET_ALL
                     )
+                yield video_export_id, archive_name
+            else:
+                log.info(
+                    "%s%s%s marked as persistent... Skipping.%s",
+                    Fore.MAGENTA,
+                    archive_name,
+                    Fore.CYAN,
+                    Style.RESET_ALL
+                )
+            if verbose:
+                log.debug("----------------------")  # Aesthetic dividing line
+
 
-                    log.debug("Searching AVL tree")
-                    result_node = avl_tree.search_in_avl_tree(AVL_TREE,
-                                                              video_export_id)
-
-                    if result_node is None:
-                        log.debug(
-                            "Creating thread for %s%s%s.",
-                            Fore.MAGENTA,
-                            archive_name,
-                            Style.RESET_ALL
-                        )
-                        thread = threading.Thread(
-                            target=remove_verkada_camera_archive,
-                            args=(video_export_id, x_verkada_token,
-                                  x_verkada_auth, usr, archive_name)
-                        )
-                        log.debug("Thread appended to list.")
-                        threads.append(thread)
-                        # Aesthetic dividing line
-                        log.debug("----------------------")
-                    else:
-                        log.info(
-                            "%s%s%s marked as persistent... Skipping.%s",
-                            Fore.MAGENTA,
-                            archive_name,
-                            Fore.CYAN,
-                            Style.RESET_ALL
-                        )
-                        # Aesthetic dividing line
-                        log.debug("----------------------")
-                else:
-                    if result_node is None:
-                        log.debug("Archive not marked as persistent.")
-                        video_export_id = archive.get("videoExportId")
-                        log.debug(
-                            "Creating thread for %s%s%s.",
-                            Fore.MAGENTA,
-                            archive_name,
-                            Style.RESET_ALL
-                        )
-
-                        thread = threading.Thread(
-                            target=remove_verkada_camera_archive,
-                            args=(video_export_id, x_verkada_token,
-                                  x_verkada_auth, usr, archive_name)
-                        )
-                        log.debug("Thread appended to list.")
-                        threads.append(thread)
-                        # Aesthetic dividing line
-                        log.debug("----------------------")
-
-    log.debug(
-        "%sThread array: %s%s.", Fore.LIGHTBLACK_EX, threads, Style.RESET_ALL)
-
-    return threads
-
-
-def remove_verkada_camera_archives(x_verkada_token, x_verkada_auth,
-                                   usr, archive_library, age_limit=AGE_LIMIT):
+def remove_verkada_camera_archives(remove_session, archive_library,
+                                   age_limit=AGE_LIMIT):
     """
     Will iterate through all Verkada archives visible to a given user and
     delete them permanently.
 
-    :param x_verkada_token: The csrf token for a valid, authenticated session.
-    :type x_verkada_token: str
-    :param x_verkada_auth: The authenticated user token for a valid Verkada
-    session.
-    :type x_verkada_auth: str
-    :param usr: The user ID for a valid user in the Verkad organization.
-    :type usr: str
+    :param remove_session: An authenticated session to use to remove
+    archives, see authenticate_session.
+    :type remove_session: requests.Session
     :param archive_library: The JSON formatted list of all visible archives in
     a Verkada organization.
     :type archive_library: list
@@ -372,190 +316,133 @@ def remove_verkada_camera_archives(x_verkada_token, x_verkada_auth,
     :return: None
     :rtype: None
     """
-    threads = []  # Array to be filled with archives to delete
-
-    log.debug("Archive library: ")
-    for archive in archive_library:
-        log.debug("%s%s%s", Fore.LIGHTBLACK_EX, archive, Style.RESET_ALL)
-        log.debug("------------")
-
-    try:
-        # Check if archives is iterable
-        log.debug("Testing if archive library variable is iterable.")
-        iter(archive_library)
-    except (TypeError, AttributeError):
-        log.error(
-            "%sError: Archives is not iterable or is None.%s",
-            Fore.RED,
-            Style.RESET_ALL
-        )
+    if not archive_library:
+        log.warning("No archives to check.")
         return
-    log.debug("%sTest complete. Continuing...%s", Fore.GREEN, Style.RESET_ALL)
+    log.debug("Archive library size: %d", len(archive_library))
 
-    if age_limit == 0:
-        # Iterate through all video export IDs and remove them
-        log.debug("Iterating through archive values.")
-        for archive in archive_library:
-            video_export_id = archive.get("videoExportId")
-
-            log.debug("Searching AVL tree.")
-            result_node = avl_tree.search_in_avl_tree(AVL_TREE,
-                                                      video_export_id)
+    targets = check_archive_timestamp(archive_library, age_limit)
 
-            # Check if the archive has been marked "persistent"
-            if result_node is None:
-                log.debug(
-                    "Age limit set to zero. Skipping age check."
-                    "\nRunning for %s%s%s.",
-                    Fore.MAGENTA,
-                    video_export_id,
-                    Style.RESET_ALL
-                )
-
-                thread = threading.Thread(
-                    target=remove_verkada_camera_archive,
-                    args=(
-                        video_export_id,
-                        x_verkada_token,
-                        x_verkada_auth,
-                        usr
-                    ))
-                # Add the thread to the array
-                threads.append(thread)
-
-    else:
-        threads.extend(check_archive_timestamp(
-            archive_library,
-            x_verkada_token,
-            x_verkada_auth,
-            usr,
-            age_limit
-        ))
-
-    if threads:
+    # Bounded pool so a large library can't spawn a thread per archive.
+    # The age check covers the whole library up front; after that, deletes
+    # are submitted as each expired archive is checked against the
+    # persistent list, so they start before that pass has finished.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = []
         try:
-            # Start in seperate thread to speed up runtime
-            for thread in threads:
-                log.debug(
-                    "Starting %s%s%s.",
-                    Fore.LIGHTYELLOW_EX,
-                    thread.name,
-                    Style.RESET_ALL
-                )
-                thread.start()
-
-            # Join all threads back to the main parent thread
-            for thread in threads:
-                log.debug(
-                    "Joining thread %s%s%s back to main.",
-                    Fore.LIGHTYELLOW_EX,
-                    thread.name,
-                    Style.RESET_ALL
-                )
-                thread.join()
-
-        except threading.ThreadError as te:
-            log.error(
-                "%sA thread error occured. %s%s",
-                Fore.RED,
-                te,
-                Style.RESET_ALL
-            )
-        except RuntimeWarning as rte:
+            for video_export_id, archive_name in targets:
+                futures.append(executor.submit(
+                    remove_verkada_camera_archive,
+                    remove_session,
+                    video_export_id,
+                    archive_name
+                ))
+        except (TypeError, AttributeError):
             log.error(
-                "%sAn error occured during the runtime. %s%s",
+                "%sError: Archives is not iterable or is None.%s",
                 Fore.RED,
-                rte,
                 Style.RESET_ALL
             )
+            # Fall through so the deletes already queued are still checked
+
+        for future in as_completed(futures):
+            try:
+                future.result()
+            # Anything one delete raises is logged so the rest still run
+            except Exception as e:
+                log.error(
+                    "%sAn archive could not be removed. %s%s",
+                    Fore.RED,
+                    e,
+                    Style.RESET_ALL
+                )
 
 
-def remove_verkada_camera_archive(remove_session, video_export_id,
-                                  x_verkada_token, x_verkada_auth, usr, name):
+def remove_verkada_camera_archive(remove_session, video_export_id, name):
     """
-    Removes a given Verkada archive that is visible to the given user and 
-    deletes it permanently.
+    Removes a given Verkada archive that is visible to the given user and
+    deletes it permanently. Callers are expected to have already filtered out
+    any archive marked as persistent.
 
-    :param remove_session: The authenticated session to use to remove archives.
+    :param remove_session: An authenticated session to use to remove
+    archives, see authenticate_session.
     :type remove_session: requests.Session
     :param video_export_id: The id of the Verkada camera archive to delete.
     :type video_export_id: str
-    :param x_verkada_token: The csrf token for a valid, authenticated session.
-    :type x_verkada_token: str
-    :param x_verkada_auth: The authenticated user token for a valid Verkada
-    session.
-    :type x_verkada_auth: str
-    :param usr: The user ID for a valid user in the Verkad organization.
-    :type usr: str
+    :param name: The display name of the archive, used for logging.
+    :type name: str
+    :return: The archive entries the server reports as removed.
+    :rtype: list
     """
-    body = {
-        "videoExportId": video_export_id
-    }
-
-    headers = {
-        "X-CSRF-Token": x_verkada_token,
-        "X-Verkada-Auth": x_verkada_auth,
-        "User": usr
-    }
+    # The body only ever carries the one ID, so splice it in directly
+    body = b'{"videoExportId":%s}' % orjson.dumps(video_export_id)
+    response = None  # Pre-define in case the post itself raises
 
-    log.debug("Searching AVL tree.")
-    result_node = avl_tree.search_in_avl_tree(AVL_TREE, video_export_id)
-
-    if result_node is None:
-        try:
-            # Post the delete request to the server
+    try:
+        # Post the delete request to the server
+        if log.isEnabledFor(logging.DEBUG):
             log.debug(
                 "Requesting deletion for %s%s%s.",
                 Fore.MAGENTA,
                 name,
                 Style.RESET_ALL
             )
-            response = remove_session.post(
-                DELETE_URL, json=body, headers=headers)
-            response.raise_for_status()  # Raise an exception for HTTP errors
-            log.info(
-                "%sDeletion for %s%s%s processed.%s",
-                Fore.GREEN,
-                Fore.MAGENTA,
-                name,
-                Fore.GREEN,
-                Style.RESET_ALL
-            )
-            # JSON response of updated value for the archive
-            removed_archive = response.json().get("videoExports", [])
-
-            # Communicate with the user which archive has been deleted
-            if removed_archive:
-                for archive in removed_archive:
-                    log.info("Removed Archive: %s", name)
-                    log.debug("%s", archive)
-                    log.debug("-------")
-            else:
-                log.warning(
-                    "Failed to remove Archive with videoExportId: %s",
-                    name
-                )
-
-                return removed_archive
-
-        # Handle exceptions
-        except requests.exceptions.RequestException as e:
-            raise custom_exceptions.APIExceptionHandler(
-                e, response, "Remove archives")
-    else:
-        log.debug(
-            "Skipping %s%s%s.%sThis archive is marked as persistent.%s.",
+        response = remove_session.post(DELETE_URL, data=body)
+        response.raise_for_status()  # Raise an exception for HTTP errors
+        log.info(
+            "%sDeletion for %s%s%s processed.%s",
+            Fore.GREEN,
             Fore.MAGENTA,
             name,
-            Style.RESET_ALL,
-            Fore.CYAN,
+            Fore.GREEN,
             Style.RESET_ALL
         )
+        # JSON response of updated value for the archive
+        removed_archive = orjson.loads(
+            response.content).get("videoExports", [])
+
+        # Communicate with the user which archive has been deleted
+        if removed_archive:
+            verbose = log.isEnabledFor(logging.DEBUG)
+            for archive in removed_archive:
+                log.info("Removed Archive: %s", name)
+                if verbose:
+                    log.debug("%s", archive)
+                    log.debug("-------")
+        else:
+            log.warning(
+                "Failed to remove Archive with videoExportId: %s",
+                name
+            )
+
+        return removed_archive
+
+    # Handle exceptions
+    except requests.exceptions.RequestException as e:
+        raise custom_exceptions.APIExceptionHandler(
+            e, response, "Remove archives")
 
 
 # Check if the script is being imported or ran directly
 if __name__ == "__main__":
     with requests.Session() as session:
+        # One kept-alive connection per delete worker, all to the same host,
+        # with throttled or briefly unavailable calls retried with backoff
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_maxsize=MAX_WORKERS,
+                pool_block=True,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=[429, 502, 503, 504],
+                    allowed_methods=["POST"],
+                    respect_retry_after_header=True,
+                    raise_on_status=False
+                )
+            )
+        )
         start_time = time.time()  # Start timing the script
         try:
             # Initialize the user session.
@@ -563,9 +450,11 @@ if __name__ == "__main__":
 
             # Continue if the required information has been received
             if csrf_token and user_token and user_id:
+                authenticate_session(
+                    session, csrf_token, user_token, user_id)
+
                 log.debug("Retrieving archive library.")
-                archives = read_verkada_camera_archives(
-                    session, csrf_token, user_token, user_id, ORG_ID)
+                archives = read_verkada_camera_archives(session, ORG_ID)
                 log.debug(
                     "%sArchive library retrieved.%s",
                     Fore.GREEN,
@@ -573,8 +462,7 @@ if __name__ == "__main__":
                 )
 
                 log.debug("Entering remove archives method.")
-                remove_verkada_camera_archives(
-                    session, csrf_token, user_token, user_id, archives)
+                remove_verkada_camera_archives(session, archives)
                 log.debug(
                     "%sProgram completed successfully.%s",
                     Fore.GREEN,
@@ -13,12 +13,14 @@ from datetime import datetime
 from os import getenv
 
 import colorama
+import orjson
 import requests
 from colorama import Fore, Style
 from dotenv import load_dotenv
 
 import custom_exceptions
 import gather_devices
+import sessions
 
 colorama.init(autoreset=True)  # Initialize colorized output
 
@@ -156,13 +158,15 @@ def run_thread_with_rate_limit(limited_threads, rate_limit=2):
     def run_thread(thread):
         limiter.acquire()
 
-        log.debug(
-            "%sStarting thread %s%s%s at time %s%s%s",
-            Fore.LIGHTBLACK_EX,
-            Fore.LIGHTYELLOW_EX, thread.name, Style.RESET_ALL,
-            Fore.LIGHTBLACK_EX,
-            datetime.now().strftime('%H:%M:%S'), Style.RESET_ALL
-        )
+        # Only format the timestamp when debug output will actually be shown
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "%sStarting thread %s%s%s at time %s%s%s",
+                Fore.LIGHTBLACK_EX,
+                Fore.LIGHTYELLOW_EX, thread.name, Style.RESET_ALL,
+                Fore.LIGHTBLACK_EX,
+                datetime.now().strftime('%H:%M:%S'), Style.RESET_ALL
+            )
 
         thread.start()
 
@@ -209,7 +213,7 @@ def login_and_get_tokens(login_session, username=USERNAME, password=PASSWORD, or
 
         # Extract relevant information from the JSON response
         log.debug("Parsing JSON response.")
-        json_response = response.json()
+        json_response = orjson.loads(response.content)
         session_token = json_response.get("csrfToken")
         session_user_token = json_response.get("userToken")
         session_user_id = json_response.get("userId")
@@ -225,6 +229,7 @@ def login_and_get_tokens(login_session, username=USERNAME, password=PASSWORD, or
 def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     """
     Logs the Python script out of Command to prevent orphaned sessions.
+    The session itself is left open; it belongs to the caller.
 
     :param x_verkada_token: The csrf token for a valid, authenticated session.
     :type x_verkada_token: str
@@ -253,9 +258,6 @@ def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     except requests.exceptions.RequestException as e:
         raise custom_exceptions.APIExceptionHandler(e, response, "Logout")
 
-    finally:
-        logout_session.close()
-
 
 ##############################################################################
                             #   Requests   #
@@ -894,7 +896,7 @@ def delete_desk_station(x_verkada_token, usr, ds_session, org_id=ORG_ID):
 
 if __name__ == '__main__':
     start_run_time = time.time()  # Start timing the script
-    with requests.Session() as session:
+    with sessions.make_session() as session:
         try:
             # Initialize the user session.
             csrf_token, user_token, user_id = login_and_get_tokens(session)
@@ -8,6 +8,7 @@ import datetime
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from os import getenv
 
 from dotenv import load_dotenv
@@ -47,6 +48,15 @@ PERSISTENT_USERS = sorted(["Ian Young", "Bruce Banner",
 PERSISTENT_PID = sorted(["751e9607-4617-43e1-9e8c-1bd439c116b6"])  # PoI ID
 PERSISTENT_LID = sorted([])  # LPoI ID
 
+# Shown once by warn() before anything is deleted
+WARN_BANNER = """\
+-------------------------------
+WARNING!!!
+Please make sure you have changed the persistent plates variable.
+Otherwise all of your plates will be deleted.
+Please double-check spelling, as well!
+-------------------------------"""
+
 # Set API endpoint URLs
 PLATE_URL = "https://api.verkada.com/cameras/v1/analytics/lpr/license_plate_of_interest"
 PERSON_URL = "https://api.verkada.com/cameras/v1/people/person_of_interest"
@@ -138,11 +148,13 @@ def run_thread_with_rate_limit(threads, rate_limit=5):
 
     def run_thread(thread):
         limiter.acquire()
-        log.debug(
-            "Starting thread %s at time %s",
-            thread.name,
-            datetime.datetime.now().strftime('%H:%M:%S')
-        )
+        # Only format the timestamp when debug output will actually be shown
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Starting thread %s at time %s",
+                thread.name,
+                datetime.datetime.now().strftime('%H:%M:%S')
+            )
         thread.start()
 
     for thread in threads:
@@ -154,16 +166,8 @@ def run_thread_with_rate_limit(threads, rate_limit=5):
 
 def warn():
     """Prints a warning message before continuing"""
-    print("-------------------------------")
-    print("WARNING!!!")
-    print("Please make sure you have changed the persistent plates variable.")
-    print("Otherwise all of your plates will be deleted.")
-    print("Please double-check spelling, as well!")
-    print("-------------------------------")
-    cont = None
-
-    while cont not in ["", " "]:
-        cont = str(input("Press enter to continue")).strip()
+    print(WARN_BANNER)
+    input("Press enter to continue\n")
 
 
 def clean_list(messy_list):
@@ -211,9 +215,10 @@ def run_people():
         log.info("Safe persons found.")
 
         # New list that filters persons that are safe
+        safe_person_set = set(safe_person_ids)  # O(1) lookups
         persons_to_delete = [
             person for person in all_person_ids
-            if person not in safe_person_ids]
+            if person not in safe_person_set]
 
         if persons_to_delete:
             poi.check(safe_person_ids, persons_to_delete, persons)
@@ -271,8 +276,9 @@ def run_plates():
         log.info("Safe plates found.")
 
         # New list that filters plates that are safe
+        safe_plate_set = set(safe_plate_ids)  # O(1) lookups
         plates_to_delete = [
-            plate for plate in all_plate_ids if plate not in safe_plate_ids
+            plate for plate in all_plate_ids if plate not in safe_plate_set
         ]
 
         if plates_to_delete:
@@ -324,8 +330,9 @@ def run_users():
         log.info("Safe users found.\n")
 
         # New list that filters users that are safe
+        safe_user_set = set(safe_user_ids)  # O(1) lookups
         users_to_delete = [
-            user for user in all_user_ids if user not in safe_user_ids]
+            user for user in all_user_ids if user not in safe_user_set]
 
         if users_to_delete:
             purge_manager = account.PurgeManager(call_count_limit=300)
@@ -357,52 +364,27 @@ def run_users():
 if __name__ == "__main__":
     warn()
 
-    poi_thread = threading.Thread(target=run_people)
-    lpoi_thread = threading.Thread(target=run_plates)
-    user_thread = threading.Thread(target=run_users)
-
-    ANSWER = None
-    while ANSWER not in ['y', 'n']:
-        ANSWER = str(input("Would you like to run for users?(y/n) "))\
-        .strip().lower()
-
-        if ANSWER == 'y':
-            RUN_USER = True
-
-    ANSWER = None
-    while ANSWER not in ['y', 'n']:
-        ANSWER = str(input("Would you like to run for PoI?(y/n) "))\
-            .strip().lower()
-
-        if ANSWER == 'y':
-            RUN_POI = True
-
-    ANSWER = None
-    while ANSWER not in ['y', 'n']:
-        ANSWER = str(input("Would you like to run for LPoI?(y/n) "))\
-            .strip().lower()
-
-        if ANSWER == 'y':
-            RUN_LPOI = True
+    # Anything other than 'y' skips that job
+    RUN_USER = input("Would you like to run for users?(y/n) ")\
+        .strip().lower() == 'y'
+    RUN_POI = input("Would you like to run for PoI?(y/n) ")\
+        .strip().lower() == 'y'
+    RUN_LPOI = input("Would you like to run for LPoI?(y/n) ")\
+        .strip().lower() == 'y'
 
     # Time the runtime
     start_time = time.time()
 
-    # Start threads
-    if RUN_USER:
-        user_thread.start()
-    if RUN_POI:
-        poi_thread.start()
-    if RUN_LPOI:
-        lpoi_thread.start()
-
-    # Join back to main thread
-    if RUN_USER:
-        user_thread.join()
-    if RUN_POI:
-        poi_thread.join()
-    if RUN_LPOI:
-        lpoi_thread.join()
+    # Only the chosen jobs are scheduled, each on its own worker
+    tasks = [task for task, run in (
+        (run_users, RUN_USER),
+        (run_people, RUN_POI),
+        (run_plates, RUN_LPOI)
+    ) if run]
+
+    with ThreadPoolExecutor(max_workers=len(tasks) or 1) as executor:
+        for future in [executor.submit(task) for task in tasks]:
+            future.result()
 
     # Wrap up in a bow and complete
     log.info(
@@ -9,10 +9,12 @@ import threading
 import time
 from os import getenv
 
+import orjson
 import requests
 from dotenv import load_dotenv
 
 import custom_exceptions
+import sessions
 
 load_dotenv()  # Load credentials file
 
@@ -138,7 +140,7 @@ def login_and_get_tokens(login_session, username=USERNAME, password=PASSWORD, or
 
         # Extract relevant information from the JSON response
         log.debug("Parsing JSON response.")
-        json_response = response.json()
+        json_response = orjson.loads(response.content)
         session_token = json_response.get("csrfToken")
         session_user_token = json_response.get("userToken")
         session_user_id = json_response.get("userId")
@@ -158,6 +160,7 @@ def login_and_get_tokens(login_session, username=USERNAME, password=PASSWORD, or
 def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     """
     Logs the Python script out of Command to prevent orphaned sessions.
+    The session itself is left open; it belongs to the caller.
 
     :param logout_session: The user session to use when making API calls.
     :type logout_session: requests.Session
@@ -195,9 +198,6 @@ def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     except KeyboardInterrupt:
         log.warning("Keyboard interrupt detected. Exiting...")
 
-    finally:
-        logout_session.close()
-
 
 ##############################################################################
                             #   Requests   #
@@ -230,7 +230,7 @@ def list_cameras(api_key, camera_session):
         log.debug("-------")
         log.debug("Camera data retrieved.")
 
-        cameras = response.json()['cameras']
+        cameras = orjson.loads(response.content)['cameras']
 
         log.debug("-------")
         for camera in cameras:
@@ -288,7 +288,7 @@ def get_sites(x_verkada_token, x_verkada_auth, usr, site_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Sites JSON retrieved. Parsing and logging.")
 
-        sites = response.json()['sites']
+        sites = orjson.loads(response.content)['sites']
 
         log.debug("-------")
         for site in sites:
@@ -344,7 +344,7 @@ def list_ac(x_verkada_token, x_verkada_auth, usr, ac_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Access control JSON retrieved. Parsing and logging.")
 
-        access_devices = response.json()['accessControllers']
+        access_devices = orjson.loads(response.content)['accessControllers']
 
         log.debug("-------")
         for controller in access_devices:
@@ -411,7 +411,7 @@ def list_alarms(x_verkada_token, x_verkada_auth, usr, alarms_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Alarm JSON retrieved. Parsing and logging.")
 
-        alarm_devices = response.json()
+        alarm_devices = orjson.loads(response.content)
 
         log.debug("-------")
         for dcs in alarm_devices['doorContactSensor']:
@@ -523,7 +523,7 @@ def list_viewing_stations(x_verkada_token, x_verkada_auth, usr, vx_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Viewing station JSON retrieved. Parsing and logging.")
 
-        vx_devices = response.json()['viewingStations']
+        vx_devices = orjson.loads(response.content)['viewingStations']
 
         log.debug("-------")
         for vx in vx_devices:
@@ -584,7 +584,7 @@ def list_gateways(x_verkada_token, x_verkada_auth, usr, gc_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Cellular gateways JSON retrieved. Parsing and logging.")
 
-        gc_devices = response.json()
+        gc_devices = orjson.loads(response.content)
 
         log.debug("-------")
         for gc in gc_devices:
@@ -644,7 +644,7 @@ def list_sensors(x_verkada_token, x_verkada_auth, usr, sv_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Environmental Sensor JSON retrieved. Parsing and logging.")
 
-        sv_devices = response.json()['sensorDevice']
+        sv_devices = orjson.loads(response.content)['sensorDevice']
 
         log.debug("-------")
         for sv in sv_devices:
@@ -704,7 +704,7 @@ def list_horns(x_verkada_token, x_verkada_auth, usr, bz_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Horn speakers JSON retrieved. Parsing and logging.")
 
-        bz_devices = response.json()['garfunkel']
+        bz_devices = orjson.loads(response.content)['garfunkel']
 
         log.debug("-------")
         for bz in bz_devices:
@@ -757,7 +757,7 @@ def list_desk_stations(x_verkada_token, usr, ds_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Desk station JSON retrieved. Parsing and logging.")
 
-        desk_stations = response.json()["deskApps"]
+        desk_stations = orjson.loads(response.content)["deskApps"]
 
         log.debug("-------")
         for ds in desk_stations:
@@ -823,7 +823,7 @@ def list_guest(x_verkada_token, x_verkada_auth, usr, guest_session,
             response.raise_for_status()  # Raise an exception for HTTP errors
             log.debug("Guest JSON retrieved. Parsing and logging.")
 
-            guest_devices = response.json()
+            guest_devices = orjson.loads(response.content)
 
             log.debug("-------")
             log.debug("Retrieving iPads for site %s.", site)
@@ -888,7 +888,7 @@ def list_acls(x_verkada_token, usr, acl_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Access control levels received.")
 
-        acls = response.json()['schedules']
+        acls = orjson.loads(response.content)['schedules']
 
         log.debug("-------")
         for acl in acls:
@@ -919,7 +919,7 @@ def list_acls(x_verkada_token, usr, acl_session,
 # Check if the script is being imported or ran directly
 if __name__ == "__main__":
 
-    with requests.Session() as session:
+    with sessions.make_session() as session:
         start_run_time = time.time()  # Start timing the script
         try:
             # Initialize the user session.
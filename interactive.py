@@ -0,0 +1,199 @@
+"""
+Author: Ian Young
+Purpose: Import into the reset scripts to share the confirmation prompt
+shown before a purge.
+"""
+
+
+def confirm(question):
+    """
+    Asks a yes/no question until it gets a valid answer.
+
+    :param question: The question to prompt the user with.
+    :type question: str
+    :return: True if the user answered 'y'.
+    :rtype: bool
+    """
+    ok = None  # Pre-define
+
+    while ok not in ['y', 'n']:
+        ok = str(input(question)).strip().lower()
+
+        if ok == 'n':
+            print("Please check the input values.")
+            print("Exiting...")
+
+        elif ok != 'y':
+            print("Invalid input. Please enter 'y' or 'n'.")
+
+    return ok == 'y'
+
+
+def compare_safe(safe, to_delete, persistent, name_of, noun):
+    """
+    Trust level 1: shows the safe entries that were found next to the
+    persistent list so the user can check that they match.
+
+    :param safe: IDs marked as safe.
+    :type safe: list
+    :param to_delete: IDs marked for deletion.
+    :type to_delete: list
+    :param persistent: The names configured as persistent, already joined
+    for display.
+    :type persistent: str
+    :param name_of: Returns the display name for an ID.
+    :type name_of: function
+    :param noun: What is being purged, e.g. "plates".
+    :type noun: str
+    :return: True if the purge should go ahead.
+    :rtype: bool
+    """
+    print("-------------------------------")
+    print("Please check that the two lists match: ")
+
+    safe_names = [name_of(record_id) for record_id in safe]
+
+    print(", ".join(safe_names))
+    print("vs")
+    print(persistent)
+    print("-------------------------------")
+
+    return confirm("Do they match?(y/n) ")
+
+
+def review_deletions(safe, to_delete, persistent, name_of, noun):
+    """
+    Trust level 2: shows everything that is about to be deleted.
+
+    :param safe: IDs marked as safe.
+    :type safe: list
+    :param to_delete: IDs marked for deletion.
+    :type to_delete: list
+    :param persistent: The names configured as persistent, already joined
+    for display.
+    :type persistent: str
+    :param name_of: Returns the display name for an ID.
+    :type name_of: function
+    :param noun: What is being purged, e.g. "plates".
+    :type noun: str
+    :return: True if the purge should go ahead.
+    :rtype: bool
+    """
+    print("-------------------------------")
+    print(f"Here are the {noun} being purged: ")
+
+    delete_names = [name_of(record_id) for record_id in to_delete]
+
+    print(", ".join(delete_names))
+    print("-------------------------------")
+
+    return confirm("Is this list accurate?(y/n) ")
+
+
+def trust_blindly(safe, to_delete, persistent, name_of, noun):
+    """
+    Trust level 3: goes ahead without showing anything. The arguments are
+    unused and only match the signature shared through TRUST_LEVELS.
+
+    :param safe: IDs marked as safe.
+    :type safe: list
+    :param to_delete: IDs marked for deletion.
+    :type to_delete: list
+    :param persistent: The names configured as persistent, already joined
+    for display.
+    :type persistent: str
+    :param name_of: Returns the display name for an ID.
+    :type name_of: function
+    :param noun: What is being purged, e.g. "plates".
+    :type noun: str
+    :return: Always True.
+    :rtype: bool
+    """
+    print("Good luck!")
+
+    return True
+
+
+def index_records(records, id_key, name_key):
+    """
+    Maps every record's ID to its display name in a single pass so names
+    can be looked up without rescanning the records.
+
+    :param records: All records found in the organization.
+    :type records: list
+    :param id_key: The key holding each record's ID, e.g. 'person_id'.
+    :type id_key: str
+    :param name_key: The key holding each record's name, e.g. 'label'.
+    :type name_key: str
+    :return: Display names keyed by ID. Records without a name are left
+    out.
+    :rtype: dict
+    """
+    # Reversed so the first record wins when an ID repeats
+    return {
+        record.get(id_key): record.get(name_key)
+        for record in reversed(records) if record.get(name_key)
+    }
+
+
+# Trust level menu, formatted once per prompt with what is being purged
+MENU = """\
+1. Check marked persistent {noun} against what the application found.
+2. Check what is marked for deletion by the application.
+3. Trust the process and blindly move forward."""
+
+# Trust level the user picks -> the check to run before purging
+TRUST_LEVELS = {
+    '1': compare_safe,
+    '2': review_deletions,
+    '3': trust_blindly
+}
+
+
+def check_purge(safe, to_delete, records, persistent, name_fn, purge_fn,
+                noun, id_key, name_key):
+    """
+    Checks with the user before continuing with the purge.
+
+    :param safe: IDs marked as safe.
+    :type safe: list
+    :param to_delete: IDs marked for deletion.
+    :type to_delete: list
+    :param records: All records found in the organization.
+    :type records: list
+    :param persistent: The names configured as persistent, already joined
+    for display.
+    :type persistent: str
+    :param name_fn: Called as name_fn(record_id, records) for IDs that
+    have no name in the records, to produce the fallback text.
+    :type name_fn: function
+    :param purge_fn: Called as purge_fn(to_delete, records) to run the
+    purge once the user agrees.
+    :type purge_fn: function
+    :param noun: What is being purged, e.g. "plates".
+    :type noun: str
+    :param id_key: The key holding each record's ID.
+    :type id_key: str
+    :param name_key: The key holding each record's display name.
+    :type name_key: str
+    :return: None
+    :rtype: None
+    """
+    trust_check = None  # Pre-define
+    names = index_records(records, id_key, name_key)  # Built once
+    menu = MENU.format(noun=noun)
+
+    def name_of(record_id):
+        """Returns the display name for an ID, falling back to name_fn."""
+        return names.get(record_id) or name_fn(record_id, records)
+
+    while trust_check is None:
+        print(menu)
+
+        trust_check = TRUST_LEVELS.get(str(input('- ')).strip())
+
+        if trust_check is None:
+            print("Invalid input. Please enter '1', '2', or '3'.")
+
+    if trust_check(safe, to_delete, persistent, name_of, noun):
+        purge_fn(to_delete, records)
@@ -12,11 +12,13 @@ import threading
 import time
 from os import getenv
 
+import orjson
 import requests
 from dotenv import load_dotenv
 from tinydb import TinyDB, Query
 
 import custom_exceptions
+import sessions
 
 load_dotenv()  # Load credentials file
 
@@ -29,6 +31,7 @@ API_KEY = getenv("")
 USERNAME = getenv("")
 PASSWORD = getenv("")
 ORG_ID = getenv("")
+LAB_KEY = getenv("LAB_KEY")
 
 # Set final, global URLs
 LOGIN_URL = "https://vprovision.command.verkada.com/user/login"
@@ -103,7 +106,7 @@ def login_and_get_tokens(login_session, username=USERNAME, password=PASSWORD, or
 
         # Extract relevant information from the JSON response
         log.debug("Parsing JSON response.")
-        json_response = response.json()
+        json_response = orjson.loads(response.content)
         session_token = json_response.get("csrfToken")
         session_user_token = json_response.get("userToken")
         session_user_id = json_response.get("userId")
@@ -123,6 +126,7 @@ def login_and_get_tokens(login_session, username=USERNAME, password=PASSWORD, or
 def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     """
     Logs the Python script out of Command to prevent orphaned sessions.
+    The session itself is left open; it belongs to the caller.
 
     :param logout_session: The user session to use when making API calls.
     :type logout_session: requests.Session
@@ -160,9 +164,6 @@ def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     except KeyboardInterrupt:
         log.warning("Keyboard interrupt detected. Exiting...")
 
-    finally:
-        logout_session.close()
-
 
 ##############################################################################
                             #   Requests   #
@@ -183,7 +184,7 @@ def get_audit_log(audit_session, audit_start, audit_end):
     :rtype: list
     """
     headers = {
-        'x-api-key': getenv("LAB_KEY"),
+        'x-api-key': LAB_KEY,
         'Content-Type': 'application/json'
     }
     url = f"{AUDIT_URL}?start_time={audit_start}&end_time={audit_end}"
@@ -194,7 +195,7 @@ def get_audit_log(audit_session, audit_start, audit_end):
         response.raise_for_status()
         log.debug("Logs retrieved.")
 
-        return response.json()['audit_logs']
+        return orjson.loads(response.content)['audit_logs']
 
     # Handle exceptions
     except requests.exceptions.RequestException as e:
@@ -230,7 +231,7 @@ def list_cameras(api_key, camera_session):
         log.debug("-------")
         log.debug("Camera data retrieved.")
 
-        cameras = response.json()['cameras']
+        cameras = orjson.loads(response.content)['cameras']
 
         log.debug("-------")
         log.debug("Cameras:")
@@ -286,7 +287,7 @@ def get_sites(x_verkada_token, x_verkada_auth, usr, site_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Sites JSON retrieved. Parsing and logging.")
 
-        sites = response.json()['sites']
+        sites = orjson.loads(response.content)['sites']
 
         log.debug("-------")
         log.debug("Sites:")
@@ -343,7 +344,7 @@ def list_ac(x_verkada_token, x_verkada_auth, usr, ac_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Access control JSON retrieved. Parsing and logging.")
 
-        access_devices = response.json()['accessControllers']
+        access_devices = orjson.loads(response.content)['accessControllers']
 
         log.debug("-------")
         log.debug("Access Controllers:")
@@ -404,7 +405,7 @@ def list_alarms(x_verkada_token, x_verkada_auth, usr, alarms_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Alarm JSON retrieved. Parsing and logging.")
 
-        alarm_devices = response.json()
+        alarm_devices = orjson.loads(response.content)
 
         log.debug("-------")
         log.debug("Door contacts:")
@@ -510,7 +511,7 @@ def list_viewing_stations(x_verkada_token, x_verkada_auth, usr, vx_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Viewing station JSON retrieved. Parsing and logging.")
 
-        vx_devices = response.json()['viewingStations']
+        vx_devices = orjson.loads(response.content)['viewingStations']
 
         log.debug("-------")
         log.debug("Viewing stations:")
@@ -567,7 +568,7 @@ def list_gateways(x_verkada_token, x_verkada_auth, usr, gc_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Cellular gateways JSON retrieved. Parsing and logging.")
 
-        gc_devices = response.json()
+        gc_devices = orjson.loads(response.content)
 
         log.debug("-------")
         log.debug("Gateways:")
@@ -623,7 +624,7 @@ def list_sensors(x_verkada_token, x_verkada_auth, usr, sv_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Environmental Sensor JSON retrieved. Parsing and logging.")
 
-        sv_devices = response.json()['sensorDevice']
+        sv_devices = orjson.loads(response.content)['sensorDevice']
 
         log.debug("-------")
         log.debug("Environmental sensors:")
@@ -680,7 +681,7 @@ def list_horns(x_verkada_token, x_verkada_auth, usr, bz_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Horn speakers JSON retrieved. Parsing and logging.")
 
-        bz_devices = response.json()['garfunkel']
+        bz_devices = orjson.loads(response.content)['garfunkel']
 
         log.debug("-------")
         log.debug("Horn speakers (BZ11):")
@@ -732,7 +733,7 @@ def list_desk_stations(x_verkada_token, usr, ds_session,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Desk station JSON retrieved. Parsing and logging.")
 
-        desk_stations = response.json()["deskApps"]
+        desk_stations = orjson.loads(response.content)["deskApps"]
 
         log.debug("-------")
         for ds in desk_stations:
@@ -800,7 +801,7 @@ def list_guest(x_verkada_token, x_verkada_auth, usr, guest_session,
             response.raise_for_status()  # Raise an exception for HTTP errors
             log.debug("Guest JSON retrieved. Parsing and logging.")
 
-            guest_devices = response.json()
+            guest_devices = orjson.loads(response.content)
 
             log.debug("-------")
             log.debug("Retrieving iPads for site %s.", site)
@@ -897,8 +898,10 @@ def get_devices_removed_from_org(serials):
             camera['time_removed'] = int(time.time())
             db.update(camera,
                       Device.serial == str(camera['serial']))
-            log.debug("--------------------")  # Aesthetic dividing line
-            log.debug(json.dumps(camera, indent=2))
+            # Only pretty-print the record when debug output is shown
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("--------------------")  # Aesthetic dividing line
+                log.debug(json.dumps(camera, indent=2))
 
     return devices_not_in_sweep
 
@@ -968,7 +971,7 @@ def get_device_removed_user(serial, audit_log_events):
 if __name__ == "__main__":
     TIME_FRAME = 3600
 
-    with requests.Session() as session:
+    with sessions.make_session() as session:
         start_run_time = time.time()  # Start timing the script
         try:
             # Initialize the user session.
@@ -11,12 +11,12 @@ import time
 from datetime import datetime
 from os import getenv
 
-import pytz
+import orjson
 import requests
 from dotenv import load_dotenv
-from tzlocal import get_localzone
 
 import custom_exceptions
+import sessions
 
 load_dotenv()  # Load credentials file
 
@@ -72,7 +72,7 @@ def login_and_get_tokens(login_session, username, password, org_id=ORG_ID):
         response.raise_for_status()
 
         # Extract relevant information from the JSON response
-        json_response = response.json()
+        json_response = orjson.loads(response.content)
         session_csrf_token = json_response.get("csrfToken")
         session_user_token = json_response.get("userToken")
         session_user_id = json_response.get("userId")
@@ -87,6 +87,7 @@ def login_and_get_tokens(login_session, username, password, org_id=ORG_ID):
 def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     """
     Logs the Python script out of Command to prevent orphaned sessions.
+    The session itself is left open; it belongs to the caller.
 
     :param logout_session: The session to use when authenticating.
     :type logout_session: requests.Session
@@ -117,9 +118,6 @@ def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     except requests.exceptions.RequestException as e:
         raise custom_exceptions.APIExceptionHandler(e, response, "Logout")
 
-    finally:
-        logout_session.close()
-
 
 def read_verkada_camera_archives(archive_session, x_verkada_token,
                                  x_verkada_auth, usr, org_id=ORG_ID):
@@ -158,7 +156,7 @@ def read_verkada_camera_archives(archive_session, x_verkada_token,
         response.raise_for_status()  # Raise an exception for HTTP errors
         log.debug("Archive IDs retrieved. Returning values.")
 
-        return response.json().get("videoExports", [])
+        return orjson.loads(response.content).get("videoExports", [])
 
     # Handle exceptions
     except requests.exceptions.RequestException as e:
@@ -176,48 +174,47 @@ def name_verkada_camera_archives(archive_library):
     :param archive_library: Library of all archives visible to the user.
     :type archive_library: list
     """
-    local_timezone = get_localzone()
-
     log.info("----------------------")  # Aesthetic dividing line
     if archive_library:
         for archive in archive_library:
             epoch_timestamp = archive.get("startBefore")
+            date = "<unknown>"  # Never reuse the previous archive's date
             if epoch_timestamp:
-                date_utc = datetime.utcfromtimestamp(epoch_timestamp)
-                date_utc = pytz.utc.localize(date_utc)
-                date_local = date_utc.astimezone(local_timezone)
-                print(local_timezone)
+                # Uses the system zone rules, so DST is applied per date
+                date_local = datetime.fromtimestamp(
+                    epoch_timestamp).astimezone()
                 date = date_local.strftime("%b %d, %Y %H:%M")
                 log.debug("Exported time: %s", date)
 
             else:
                 log.warning("Missing timestamp from archive.")
 
-            if archive.get('label') != '':
+            # Read each field once
+            label = archive.get('label')
+            tags = archive.get('tags')
+            video_export_id = archive.get('videoExportId')
+
+            if label:
                 log.info(
                     "%s\nArchive label: %s\n%s",
                     date,
-                    archive.get('label'),
-                    archive.get('videoExportId')
+                    label,
+                    video_export_id
                 )
-                log.info("----------------------")  # Aesthetic dividing line
 
-            elif archive.get('tags') != []:
+            elif tags:
                 log.info(
                     "%s\nArchive has no name. Tags %s\n%s",
                     date,
-                    archive.get('tags'),
-                    archive.get('videoExportId')
+                    tags,
+                    video_export_id
                 )
-                log.info("----------------------")  # Aesthetic dividing line
 
             else:
                 log.info(date)
-                log.info(
-                    "No name found. Archive ID: %s",
-                    archive.get('videoExportId')
-                )
-                log.info("----------------------")  # Aesthetic dividing line
+                log.info("No name found. Archive ID: %s", video_export_id)
+
+            log.info("----------------------")  # Aesthetic dividing line
     else:
         log.critical("Empty library.")
 
@@ -228,7 +225,7 @@ if __name__ == "__main__":
         start_time = time.time()
 
         # Start the user session
-        with requests.Session() as session:
+        with sessions.make_session() as session:
             csrf_token, user_token, user_id = login_and_get_tokens(
                 session, USERNAME, PASSWORD)
 
@@ -7,29 +7,34 @@ Command. Any person or plate not marked thusly will be deleted from the org.
 """
 # Import essential libraries
 import logging
+import random
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from os import getenv
 
-import datetime
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 import custom_exceptions
 
 load_dotenv()  # Load credentials file
 
-ORG_ID = getenv("")
-API_KEY = getenv("")
+ORG_ID = getenv("ORG_ID")
+API_KEY = getenv("API_KEY")
 
 # This will help prevent exceeding the call limit
 CALL_COUNT = 0
 CALL_COUNT_LOCK = threading.Lock()
 
+# Most deletes allowed in flight at once
+MAX_WORKERS = 10
+
 # Set timeout for a 429
 MAX_RETRIES = 10
 DEFAULT_RETRY_DELAY = 0.25
-BACKOFF = 0.25
+MAX_RETRY_DELAY = 30
 
 # Set logger
 log = logging.getLogger()
@@ -46,11 +51,29 @@ logging.getLogger("urllib3").setLevel(logging.CRITICAL)
 PERSISTENT_PLATES = []
 PERSISTENT_PERSONS = []
 
+# Shown once by warn() before anything is deleted
+WARN_BANNER = """\
+-------------------------------
+WARNING!!!
+Please make sure you have changed the persistent plates/persons variable.
+Otherwise all of your plates/persons will be deleted.
+Please double-check spelling, as well!
+-------------------------------"""
+
 # Set API endpoint URLs
 PLATE_URL = "https://api.verkada.com/cameras/v1/\
 analytics/lpr/license_plate_of_interest"
 PERSON_URL = "https://api.verkada.com/cameras/v1/people/person_of_interest"
 
+# Shared keep-alive pool for every call so each delete reuses an open
+# connection. 429s are retried by the delete loops, not the adapter.
+SESSION = requests.Session()
+SESSION.headers.update({"accept": "application/json"})
+SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0)
+)
+
 
 ##############################################################################
                                 #  Misc  #
@@ -59,109 +82,208 @@ PERSON_URL = "https://api.verkada.com/cameras/v1/people/person_of_interest"
 
 class RateLimiter:
     """
-    The purpose of this class is to limit how fast multi-threaded actions are
-    created to prevent hitting the API limit.
+    Token bucket used to limit how fast multi-threaded actions are created
+    to prevent hitting the API limit. Up to `capacity` actions may burst at
+    once, after which tokens refill evenly over `fill_time` seconds.
     """
 
-    def __init__(self, rate_limit, max_events_per_sec=10, pacing=1):
+    def __init__(self, capacity=10, fill_time=1.0):
         """
         Initilization of the rate limiter.
 
-        :param rate_limit: The value of how many threads may be made each sec.
-        :type rate_limit: int
-        :param max_events_per_sec: Maximum events allowed per second.
-        :type: int, optional
-        :param pacing: Sets the interval of the clock in seconds.
-        :type pacing: int, optional
+        :param capacity: The most actions that may be made back to back.
+        :type capacity: int, optional
+        :param fill_time: Seconds it takes to refill an empty bucket.
+        :type fill_time: float, optional
         :return: None
         :rtype: None
         """
-        self.rate_limit = rate_limit
+        self.capacity = capacity
+        self.fill_rate = capacity / fill_time  # Tokens regained per second
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
         self.lock = threading.Lock()  # Local lock to prevent race conditions
-        self.max_events_per_sec = max_events_per_sec
-        self.pacing = pacing
-        self.start_time = 0
-        self.event_count = 0
 
     def acquire(self):
         """
-        States whether or not the program may create new threads or not.
+        Takes a token, waiting for one to refill if the bucket is empty. The
+        token is reserved under the lock and the wait happens outside of it,
+        so waiting callers don't block each other's bookkeeping.
 
-        :return: Boolean value stating whether new threads may be made or not.
-        :rtype: bool
+        :return: None
+        :rtype: None
         """
         with self.lock:
-            current_time = time.time()  # Define current time
-
-            if not hasattr(self, 'start_time'):
-                # Check if attribue 'start_time' exists, if not, make it.
-                self.start_time = current_time
-                self.event_count = self.pacing
-                return True
-
-            # How much time has passed since starting
-            elapsed_since_start = current_time - self.start_time
-
-            # Check if it's been less than 1sec and less than 10 events have
-            # been made.
-            if elapsed_since_start < self.pacing / self.rate_limit \
-                    and self.event_count < self.max_events_per_sec:
-                self.event_count += 1
-                return True
-
-            # Check if it is the first wave of events
-            elif elapsed_since_start >= self.pacing / self.rate_limit:
-                self.start_time = current_time
-                self.event_count = 2
-                return True
-
-            else:
-                # Calculate the time left before next wave
-                remaining_time = self.pacing - \
-                    (current_time - self.start_time)
-                time.sleep(remaining_time)  # Wait before next wave
-                return True
-
-
-def run_thread_with_rate_limit(threads, rate_limit=10):
-    """
-    Run a thread with rate limiting.
-
-    :param target: The target function to be executed in the thread:
-    :type targe: function:
-    :return: The thread that was created and ran
-    :rtype: thread
-    """
-    limiter = RateLimiter(rate_limit=rate_limit)
-
-    def run_thread(thread):
-        limiter.acquire()
-        log.debug(
-            "Starting thread %s at time %s",
-            thread.name,
-            datetime.datetime.now().strftime('%H:%M:%S')
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.last_refill) * self.fill_rate
+            )
+            self.last_refill = now
+            self.tokens -= 1
+            wait = -self.tokens / self.fill_rate if self.tokens < 0 else 0
+
+        if wait:
+            time.sleep(wait)
+
+
+# One bucket for the whole module so the limit spans every purge
+LIMITER = RateLimiter()
+
+
+def retry_delay(response, attempt):
+    """
+    Works out how long to wait before retrying a throttled request. The
+    server's Retry-After header wins when present, otherwise the delay
+    doubles each attempt with a little jitter so threads don't retry in
+    lockstep.
+
+    :param response: The 429 response that was received.
+    :type response: requests.Response
+    :param attempt: How many retries have already been made.
+    :type attempt: int
+    :return: The number of seconds to wait.
+    :rtype: float
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass  # HTTP-date form, fall back to backoff
+
+    return min(MAX_RETRY_DELAY, DEFAULT_RETRY_DELAY * 2 ** attempt) \
+        + random.uniform(0, DEFAULT_RETRY_DELAY)
+
+
+def delete_entity(url, params, name, service, api_key=API_KEY):
+    """
+    Deletes a single PoI or LPoI, retrying while the API throttles the
+    request. Shared by delete_person and delete_plate so both take the same
+    hot path.
+
+    :param url: The endpoint the entity lives under.
+    :type url: str
+    :param params: Query parameters identifying the org and the entity.
+    :type params: dict
+    :param name: The display name of the entity, used for logging.
+    :type name: str
+    :param service: Prefix for log messages, e.g. "Person" or "Plate".
+    :type service: str
+    :param api_key: API key for authentication. Defaults to API_KEY.
+    :type api_key: str, optional
+    :return: None
+    :rtype: None
+    """
+    LIMITER.acquire()  # Wait for a token before calling the API
+
+    headers = {"x-api-key": api_key}
+    response = None  # Pre-define in case the first call raises
+
+    log.info("Running for %s: %s", service.lower(), name)
+
+    try:
+        for attempt in range(MAX_RETRIES):
+            response = SESSION.delete(
+                url,
+                headers=headers,
+                params=params,
+                timeout=5
+            )
+
+            code = response.status_code  # Read once, dispatch below
+            if code != 429 or attempt == MAX_RETRIES - 1:
+                break  # Done, or out of retries so don't sleep again
+
+            delay = retry_delay(response, attempt)
+            log.info(
+                "%s response: 429. Retrying in %.2fs.",
+                name,
+                delay
+            )
+
+            time.sleep(delay)
+
+        if code == 429:
+            raise custom_exceptions.APIThrottleException("API throttled")
+
+        elif code == 504:
+            log.warning("%s - %s Timed out.", service, name)
+
+        elif code == 400:
+            log.warning("%s - Contact support: endpoint failure", service)
+
+        elif code != 200:
+            log.error(
+                "%s - An error has occured. Status code %s",
+                service,
+                code
+            )
+
+    # Handle exceptions
+    except custom_exceptions.APIThrottleException:
+        log.critical(
+            "%s - Hit API request rate limit of 500 requests per minute.",
+            service
         )
-        thread.start()
 
-    for thread in threads:
-        run_thread(thread)
+    except requests.exceptions.RequestException as e:
+        raise custom_exceptions.APIExceptionHandler(
+            e, response, f"{service} -")
+
+
+def purge_entities(delete, names, delete_func, service,
+                   org_id=ORG_ID, api_key=API_KEY):
+    """
+    Deletes every given PoI or LPoI on a bounded pool of workers. Shared
+    by purge_people and purge_plates.
+
+    :param delete: A list of entity IDs to be deleted from the
+    organization.
+    :type delete: list
+    :param names: Display names of the entities, keyed by ID.
+    :type names: dict
+    :param delete_func: Deletes one entity, e.g. delete_person.
+    :type delete_func: function
+    :param service: Prefix for log messages, e.g. "Person" or "Plate".
+    :type service: str
+    :param org_id: Organization ID. Defaults to ORG_ID.
+    :type org_id: str, optional
+    :param api_key: API key for authentication. Defaults to API_KEY.
+    :type api_key: str, optional
+    :return: Returns the value of 1 if completed successfully.
+    :rtype: int
+    """
+    if not delete:
+        log.warning("%s - There's nothing here", service)
+        return
+
+    log.info("%s - Purging...", service)
+
+    start_time = time.time()
+    # Bounded pool; each worker waits on the shared limiter before calling
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for future in [
+            executor.submit(delete_func, entity, names, org_id, api_key)
+            for entity in delete
+        ]:
+            try:
+                future.result()
+            except custom_exceptions.APIExceptionHandler as e:
+                log.error("%s - Delete failed. %s", service, e)
 
-    for thread in threads:
-        thread.join()
+    elapsed_time = time.time() - start_time
+
+    log.info("%s - Purge complete.", service)
+    log.info("%s - Time to complete: %.2f", service, elapsed_time)
+
+    return 1  # Completed
 
 
 def warn():
     """Prints a warning message before continuing"""
-    print("-------------------------------")
-    print("WARNING!!!")
-    print("Please make sure you have changed the persistent plates variable.")
-    print("Otherwise all of your plates will be deleted.")
-    print("Please double-check spelling, as well!")
-    print("-------------------------------")
-    cont = None
-
-    while cont not in ["", " "]:
-        cont = str(input("Press enter to continue\n")).strip()
+    print(WARN_BANNER)
+    input("Press enter to continue\n")
 
 
 def clean_list(messy_list):
@@ -182,7 +304,7 @@ def clean_list(messy_list):
 ##############################################################################
 
 
-def check_people(safe, to_delete, persons):
+def check_people(safe, to_delete, person_names):
     """
     Checks with the user before continuing with the purge.
 
@@ -190,37 +312,42 @@ def check_people(safe, to_delete, persons):
     :type safe: list
     :param to_delete: A list of people to delete during the purge.
     :type to_delete: list
-    :param persons: A list of all people found in the organization.
-    :type persons: list
+    :param person_names: Labels of every person in the organization, keyed
+    by person ID.
+    :type person_names: dict
     """
     trust_level = None  # Pre-define
     ok = None  # Pre-define
 
     while trust_level not in ['1', '2', '3']:
-        print("1. Check marked persistent persons against what the \
-application found.")
-        print("2. Check what is marked for deletion by the application.")
-        print("3. Trust the process and blindly move forward.")
+        # One write per prompt instead of one per line
+        print(
+            "1. Check marked persistent persons against what the "
+            "application found.",
+            "2. Check what is marked for deletion by the application.",
+            "3. Trust the process and blindly move forward.",
+            sep="\n"
+        )
 
         trust_level = str(input('- ')).strip()
 
         if trust_level == '1':
-            print("-------------------------------")
-            print("Please check that the two lists match: ")
-
-            safe_names = [print_person_name(person_id, persons)
-                          for person_id in safe]
-
-            print(", ".join(safe_names))
-            print("vs")
-            print(", ".join(PERSISTENT_PERSONS))
-            print("-------------------------------")
+            print(
+                "-------------------------------",
+                "Please check that the two lists match: ",
+                ", ".join(print_person_name(person_id, person_names)
+                          for person_id in safe),
+                "vs",
+                ", ".join(PERSISTENT_PERSONS),
+                "-------------------------------",
+                sep="\n"
+            )
 
             while ok not in ['y', 'n']:
                 ok = str(input("Do they match?(y/n) ")).strip().lower()
 
                 if ok == 'y':
-                    purge_people(to_delete, persons)
+                    purge_people(to_delete, person_names)
 
                 elif ok == 'n':
                     print("Please check the input values")
@@ -230,21 +357,21 @@ application found.")
                     print("Invalid input. Please enter 'y' or 'n'.")
 
         elif trust_level == '2':
-            print("-------------------------------")
-            print("Here are the persons being purged: ")
-
-            delete_names = \
-                [print_person_name(person_id, persons)
-                 for person_id in to_delete]
-            print(", ".join(delete_names))
-            print("-------------------------------")
+            print(
+                "-------------------------------",
+                "Here are the persons being purged: ",
+                ", ".join(print_person_name(person_id, person_names)
+                          for person_id in to_delete),
+                "-------------------------------",
+                sep="\n"
+            )
 
             while ok not in ['y', 'n']:
                 ok = \
                     str(input("Is this list accurate?(y/n) ")).strip().lower()
 
                 if ok == 'y':
-                    purge_people(to_delete, persons)
+                    purge_people(to_delete, person_names)
 
                 elif ok == 'n':
                     print("Please check the input values.")
@@ -255,7 +382,7 @@ application found.")
 
         elif trust_level == '3':
             print("Good luck!")
-            purge_people(to_delete, persons)
+            purge_people(to_delete, person_names)
 
         else:
             print("Invalid input. Please enter '1', '2', or '3'.")
@@ -272,16 +399,13 @@ def get_people(org_id=ORG_ID, api_key=API_KEY):
     :return: A List of dictionaries of people in an organization.
     :rtype: list
     """
-    headers = {
-        "accept": "application/json",
-        "x-api-key": api_key
-    }
+    headers = {"x-api-key": api_key}
 
     params = {
         "org_id": org_id,
     }
 
-    response = requests.get(
+    response = SESSION.get(
         PERSON_URL,
         headers=headers,
         params=params,
@@ -294,11 +418,9 @@ def get_people(org_id=ORG_ID, api_key=API_KEY):
         # Extract as a list
         persons = data.get('persons_of_interest')
 
-        try:
-            iter(persons)
-        except (TypeError, AttributeError):
+        if not isinstance(persons, list):
             log.error("People are not iterable.")
-            return
+            return None
 
         return persons
     else:
@@ -320,37 +442,32 @@ def get_people_ids(persons=None):
     :return: A list of IDs of the PoIs in an organization.
     :rtype: list
     """
-    person_id = []
+    person_id = [pid for person in persons if (pid := person.get('person_id'))]
+
+    if len(person_id) != len(persons):
+        for person in persons:
+            if not person.get('person_id'):
+                log.error(
+                    "There has been an error with person %s.",
+                    person.get('label')
+                )
 
-    for person in persons:
-        if person.get('person_id'):
-            person_id.append(person.get('person_id'))
-        else:
-            log.error(
-                "There has been an error with person %s.",
-                person.get('label')
-            )
     return person_id
 
 
-def get_person_id(person, persons=None):
+def get_person_id(person, person_ids=None):
     """
     Returns the Verkada ID for a given PoI.
 
     :param person: The label of a PoI whose ID is being searched for.
     :type person: str
-    :param persons: A list of PoI IDs found inside of an organization.
-    Each dictionary should have the 'person_id' key. Defaults to None.
-    :type persons: list, optional
+    :param person_ids: PoI IDs found inside of an organization, keyed by
+    label. Defaults to None.
+    :type person_ids: dict, optional
     :return: The person ID of the given PoI.
     :rtype: str
     """
-    person_id = None  # Pre-define
-
-    for name in persons:
-        if name['label'] == person:
-            person_id = name['person_id']
-            break  # No need to continue running once found
+    person_id = person_ids.get(person)
 
     if person_id:
         return person_id
@@ -359,14 +476,14 @@ def get_person_id(person, persons=None):
         return None
 
 
-def delete_person(person, persons, org_id=ORG_ID, api_key=API_KEY):
+def delete_person(person, person_names, org_id=ORG_ID, api_key=API_KEY):
     """
     Deletes the given person from the organization.
 
     :param person: The person to be deleted.
     :type person: str
-    :param persons: A list of PoI IDs found inside of an organization.
-    :type persons: list
+    :param person_names: Labels of PoIs in the organization, keyed by ID.
+    :type person_names: dict
     :param org_id: Organization ID. Defaults to ORG_ID.
     :type org_id: str, optional
     :param api_key: API key for authentication. Defaults to API_KEY.
@@ -374,64 +491,28 @@ def delete_person(person, persons, org_id=ORG_ID, api_key=API_KEY):
     :return: None
     :rtype: None
     """
-    local_data = threading.local()
-    local_data.RETRY_DELAY = DEFAULT_RETRY_DELAY
-
-    headers = {
-        "accept": "application/json",
-        "x-api-key": api_key
-    }
-
-    log.info("Running for person: %s", print_person_name(person, persons))
-
     params = {
         'org_id': org_id,
         'person_id': person
     }
 
-    try:
-        for _ in range(MAX_RETRIES):
-            response = requests.delete(
-                PERSON_URL,
-                headers=headers,
-                params=params,
-                timeout=5
-            )
-
-            if response.status_code == 429:
-                log.info(
-                    "%s response: 429. Retrying in %ss.",
-                    print_person_name(person, persons),
-                    local_data.RETRY_DELAY
-                )
-
-                time.sleep(local_data.RETRY_DELAY)
-
-                local_data.RETRY_DELAY += BACKOFF
-
-            else:
-                break
-
-        if response.status_code == 429:
-            raise custom_exceptions.APIThrottleException("API throttled")
-
-    # Handle exceptions
-    except custom_exceptions.APIThrottleException:
-        log.critical(
-            "Person - Hit API request rate limit of 500 requests per minute.")
-
-    except requests.exceptions.RequestException as e:
-        raise custom_exceptions.APIExceptionHandler(e, response, "Person -")
+    delete_entity(
+        PERSON_URL,
+        params,
+        print_person_name(person, person_names),
+        "Person",
+        api_key
+    )
 
 
-def purge_people(delete, persons, org_id=ORG_ID, api_key=API_KEY):
+def purge_people(delete, person_names, org_id=ORG_ID, api_key=API_KEY):
     """
     Purges all PoIs that aren't marked as safe/persistent.
 
     :param delete: A list of PoIs to be deleted from the organization.
     :type delete: list
-    :param persons: A list of PoIs found inside of an organization.
-    :type persons: list
+    :param person_names: Labels of PoIs in the organization, keyed by ID.
+    :type person_names: dict
     :param org_id: Organization ID. Defaults to ORG_ID.
     :type org_id: str, optional
     :param api_key: API key for authentication. Defaults to API_KEY.
@@ -439,54 +520,24 @@ def purge_people(delete, persons, org_id=ORG_ID, api_key=API_KEY):
     :return: Returns the value of 1 if completed successfully.
     :rtype: int
     """
-    if not delete:
-        log.warning("Person - There's nothing here")
-        return
-
-    log.info("Person - Purging...")
-
-    person_start_time = time.time()
-    threads = []
-    for person in delete:
-        # Toss delete function into a new thread
-        thread = threading.Thread(
-            target=delete_person, args=(person, persons, org_id, api_key,)
-        )
-        threads.append(thread)  # Add the thread to the pile
-
-    run_thread_with_rate_limit(threads)
+    return purge_entities(
+        delete, person_names, delete_person, "Person", org_id, api_key)
 
-    person_end_time = time.time()
-    person_elapsed_time = person_end_time - person_start_time
 
-    log.info("Person - Purge complete.")
-    log.info(
-        "Person - Time to complete: %.2f",
-        person_elapsed_time
-    )
-
-    return 1  # Completed
-
-
-def print_person_name(to_delete, persons):
+def print_person_name(to_delete, person_names):
     """
     Returns the label of a PoI with a given ID
 
     :param to_delete: The person ID whose name is being searched for in the
     dictionary.
     :type to_delete: str
-    :param persons: A list of PoIs found inside of an organization.
-    :type persons: list
+    :param person_names: Labels of PoIs in the organization, keyed by ID.
+    :type person_names: dict
     :return: Returns the name of the person searched for. Will return if there
     was no name found, as well.
     :rtype: str
     """
-    person_name = None  # Pre-define
-
-    for person in persons:
-        if person.get('person_id') == to_delete:
-            person_name = person.get('label')
-            break  # No need to continue running once found
+    person_name = person_names.get(to_delete)
 
     if person_name:
         return person_name
@@ -494,44 +545,57 @@ def print_person_name(to_delete, persons):
         return "No name provided"
 
 
-def run_people():
+def run_people(persons=None):
     """
     Allows the program to be ran if being imported as a module.
 
+    :param persons: PoIs that were already retrieved from the organization.
+    They are fetched here when not given. Defaults to None.
+    :type persons: list, optional
     :return: Returns the value 1 if the program completed successfully.
     :rtype: int
     """
-    log.info("Retrieving persons")
-    persons = get_people()
-    log.info("persons retrieved.")
-
-    # Sort JSON dictionaries by person id
-    persons = sorted(persons, key=lambda x: x['person_id'])
+    if persons is None:
+        log.info("Retrieving persons")
+        persons = get_people()
+        log.info("persons retrieved.")
 
     # Run if persons were found
     if persons:
         log.info("Person - Gather IDs")
-        all_person_ids = get_people_ids(persons)
-        all_person_ids = clean_list(all_person_ids)
+        all_person_ids = get_people_ids(persons)  # Never contains None
         log.info("Person - IDs aquired.")
 
+        # Build both lookups once so every name/ID resolution is O(1).
+        # Iterating in reverse keeps the first PoI with a repeated label.
+        person_names = {
+            person['person_id']: person.get('label')
+            for person in persons if person.get('person_id')
+        }
+        person_ids = {
+            person.get('label'): person['person_id']
+            for person in reversed(persons) if person.get('person_id')
+        }
+
         safe_person_ids = []
 
         log.info("Searching for safe persons.")
         # Create the list of safe persons
         for person in PERSISTENT_PERSONS:
-            safe_person_ids.append(get_person_id(person, persons))
+            safe_person_ids.append(get_person_id(person, person_ids))
         safe_person_ids = clean_list(safe_person_ids)
 
         log.info("Safe persons found.")
 
-        # New list that filters persons that are safe
+        # New list that filters persons that are safe, a set keeps each
+        # membership test O(1)
+        safe_person_set = set(safe_person_ids)
         persons_to_delete = [
             person for person in all_person_ids
-            if person not in safe_person_ids]
+            if person not in safe_person_set]
 
         if persons_to_delete:
-            check_people(safe_person_ids, persons_to_delete, persons)
+            check_people(safe_person_ids, persons_to_delete, person_names)
             return 1  # Completed
 
         else:
@@ -553,7 +617,7 @@ There are no more persons to delete.")
 ##############################################################################
 
 
-def check_plates(safe, to_delete, plates):
+def check_plates(safe, to_delete, plate_names):
     """
     Checks with the user before continuing with the purge.
 
@@ -561,37 +625,42 @@ def check_plates(safe, to_delete, plates):
     :type safe: list
     :param to_delete: Plate sthat are marked to be deleted during the purge.
     :type to_delete: list
-    :param plates: A list of all plates found in a Verkada organization.
-    :type plates: list
+    :param plate_names: Descriptions of every plate in a Verkada
+    organization, keyed by license plate.
+    :type plate_names: dict
     """
     trust_level = None  # Pre-define
     ok = None  # Pre-define
 
     while trust_level not in ['1', '2', '3']:
-        print("1. Check marked persistent plates against what the \
-application found.")
-        print("2. Check what is marked for deletion by the application.")
-        print("3. Trust the process and blindly move forward.")
+        # One write per prompt instead of one per line
+        print(
+            "1. Check marked persistent plates against what the "
+            "application found.",
+            "2. Check what is marked for deletion by the application.",
+            "3. Trust the process and blindly move forward.",
+            sep="\n"
+        )
 
         trust_level = str(input('- ')).strip()
 
         if trust_level == '1':
-            print("-------------------------------")
-            print("Please check that the two lists match: ")
-
-            safe_names = [print_plate_name(plate_id, plates)
-                          for plate_id in safe]
-
-            print(", ".join(safe_names))
-            print("vs")
-            print(", ".join(PERSISTENT_PLATES))
-            print("-------------------------------")
+            print(
+                "-------------------------------",
+                "Please check that the two lists match: ",
+                ", ".join(print_plate_name(plate_id, plate_names)
+                          for plate_id in safe),
+                "vs",
+                ", ".join(PERSISTENT_PLATES),
+                "-------------------------------",
+                sep="\n"
+            )
 
             while ok not in ['y', 'n']:
                 ok = str(input("Do they match?(y/n) ")).strip().lower()
 
                 if ok == 'y':
-                    purge_plates(to_delete, plates)
+                    purge_plates(to_delete, plate_names)
 
                 elif ok == 'n':
                     print("Please check the input values")
@@ -601,20 +670,21 @@ application found.")
                     print("Invalid input. Please enter 'y' or 'n'.")
 
         elif trust_level == '2':
-            print("-------------------------------")
-            print("Here are the plates being purged: ")
-
-            delete_names = \
-                [print_plate_name(plate_id, plates) for plate_id in to_delete]
-            print(", ".join(delete_names))
-            print("-------------------------------")
+            print(
+                "-------------------------------",
+                "Here are the plates being purged: ",
+                ", ".join(print_plate_name(plate_id, plate_names)
+                          for plate_id in to_delete),
+                "-------------------------------",
+                sep="\n"
+            )
 
             while ok not in ['y', 'n']:
                 ok = \
                     str(input("Is this list accurate?(y/n) ")).strip().lower()
 
                 if ok == 'y':
-                    purge_plates(to_delete, plates)
+                    purge_plates(to_delete, plate_names)
 
                 elif ok == 'n':
                     print("Please check the input values.")
@@ -625,7 +695,7 @@ application found.")
 
         elif trust_level == '3':
             print("Good luck!")
-            purge_plates(to_delete, plates)
+            purge_plates(to_delete, plate_names)
 
         else:
             print("Invalid input. Please enter '1', '2', or '3'.")
@@ -642,16 +712,13 @@ def get_plates(org_id=ORG_ID, api_key=API_KEY):
     :return: A List of dictionaries of license plates in an organization.
     :rtype: list
     """
-    headers = {
-        "accept": "application/json",
-        "x-api-key": api_key
-    }
+    headers = {"x-api-key": api_key}
 
     params = {
         "org_id": org_id,
     }
 
-    response = requests.get(
+    response = SESSION.get(
         PLATE_URL,
         headers=headers,
         params=params,
@@ -664,12 +731,9 @@ def get_plates(org_id=ORG_ID, api_key=API_KEY):
         # Extract as a list
         plates = data.get('license_plate_of_interest')
 
-        try:
-            # Check if the list is iterable
-            iter(plates)
-        except (TypeError, AttributeError):
+        if not isinstance(plates, list):
             log.error("Plates are not iterable.")
-            return
+            return None
 
         return plates
     else:
@@ -691,38 +755,32 @@ def get_plate_ids(plates=None):
     :return: A list of IDs of the LPoIs in an organization.
     :rtype: list
     """
-    plate_id = []
+    plate_id = [pid for plate in plates if (pid := plate.get('license_plate'))]
 
-    for plate in plates:
-        if plate.get('license_plate'):
-            plate_id.append(plate.get('license_plate'))
-        else:
-            log.error(
-                "Plate - There has been an error with plate %s.",
-                plate.get('label')
-            )
+    if len(plate_id) != len(plates):
+        for plate in plates:
+            if not plate.get('license_plate'):
+                log.error(
+                    "Plate - There has been an error with plate %s.",
+                    plate.get('description')
+                )
 
     return plate_id
 
 
-def get_plate_id(plate, plates=None):
+def get_plate_id(plate, plate_ids=None):
     """
     Returns the Verkada ID for a given LPoI.
 
     :param plate: The label of a LPoI whose ID is being searched for.
     :type plate: str
-    :param plates: A list of LPoI IDs found inside of an organization.
-    Each dictionary should have the 'license_plate' key. Defaults to None.
-    :type plates: list, optional
+    :param plate_ids: LPoI IDs found inside of an organization, keyed by
+    description. Defaults to None.
+    :type plate_ids: dict, optional
     :return: The plate ID of the given LPoI.
     :rtype: str
     """
-    plate_id = None  # Pre-define
-
-    for name in plates:
-        if name['description'] == plate:
-            plate_id = name['license_plate']
-            break  # No need to continue running once found
+    plate_id = plate_ids.get(plate)
 
     if plate_id:
         return plate_id
@@ -734,14 +792,15 @@ def get_plate_id(plate, plates=None):
         return None
 
 
-def delete_plate(plate, plates, org_id=ORG_ID, api_key=API_KEY):
+def delete_plate(plate, plate_names, org_id=ORG_ID, api_key=API_KEY):
     """
     Deletes the given plate from the organization.
 
     :param plate: The plate to be deleted.
     :type plate: str
-    :param plates: A list of LPoI IDs found inside of an organization.
-    :type plates: list
+    :param plate_names: Descriptions of LPoIs in the organization, keyed by
+    license plate.
+    :type plate_names: dict
     :param org_id: Organization ID. Defaults to ORG_ID.
     :type org_id: str, optional
     :param api_key: API key for authentication. Defaults to API_KEY.
@@ -749,78 +808,29 @@ def delete_plate(plate, plates, org_id=ORG_ID, api_key=API_KEY):
     :return: None
     :rtype: None
     """
-    local_data = threading.local()
-    local_data.RETRY_DELAY = DEFAULT_RETRY_DELAY
-
-    headers = {
-        "accept": "application/json",
-        "x-api-key": api_key
-    }
-
-    log.info(
-        "Running for plate: %s",
-        print_plate_name(plate, plates)
-    )
-
     params = {
         'org_id': org_id,
         'license_plate': plate
     }
 
-    try:
-        for _ in range(MAX_RETRIES):
-            response = requests.delete(
-                PLATE_URL,
-                headers=headers,
-                params=params,
-                timeout=5
-            )
-
-            if response.status_code == 429:
-                log.info(
-                    "%s response: 429. Retrying in %ss.",
-                    print_plate_name(plate, plates),
-                    local_data.RETRY_DELAY
-                )
-
-                time.sleep(local_data.RETRY_DELAY)
-
-                local_data.RETRY_DELAY += BACKOFF
-
-            else:
-                break
-
-        if response.status_code == 429:
-            raise custom_exceptions.APIThrottleException("API throttled")
-
-        elif response.status_code == 504:
-            log.warning(
-                "Plate - %s Timed out.",
-                print_plate_name(plate, plates)
-            )
-
-        elif response.status_code == 400:
-            log.warning("Plate - Contact support: endpoint failure")
-
-        elif response.status_code != 200:
-            log.error(
-                "Plate - An error has occured. Status code %s",
-                response.status_code
-            )
-
-    except custom_exceptions.APIThrottleException:
-        log.critical(
-            "Plate - Hit API request rate limit of 500 requests per minute.")
+    delete_entity(
+        PLATE_URL,
+        params,
+        print_plate_name(plate, plate_names),
+        "Plate",
+        api_key
+    )
 
 
-def purge_plates(delete, plates, org_id=ORG_ID, api_key=API_KEY):
+def purge_plates(delete, plate_names, org_id=ORG_ID, api_key=API_KEY):
     """
     Purges all LPoIs that aren't marked as safe/persistent.
 
     :param delete: A list of LPoIs to be deleted from the organization.
     :type delete: list
-    :param plates: A list of LPoIs found inside of an organization.
-    :type plates: list
+    :param plate_names: Descriptions of LPoIs in the organization, keyed by
+    license plate.
+    :type plate_names: dict
     :param org_id: Organization ID. Defaults to ORG_ID.
     :type org_id: str, optional
     :param api_key: API key for authentication. Defaults to API_KEY.
@@ -828,52 +838,25 @@ def purge_plates(delete, plates, org_id=ORG_ID, api_key=API_KEY):
     :return: Returns the value of 1 if completed successfully.
     :rtype: int
     """
+    return purge_entities(
+        delete, plate_names, delete_plate, "Plate", org_id, api_key)
 
-    if not delete:
-        log.warning("Plate - There's nothing here")
-        return
-
-    log.info("Plate - Purging...")
 
-    plate_start_time = time.time()
-    threads = []
-    for plate in delete:
-        # Toss delete function into a new thread
-        thread = threading.Thread(
-            target=delete_plate, args=(plate, plates, org_id, api_key,)
-        )
-        threads.append(thread)  # Add the thread to the pile
-
-    run_thread_with_rate_limit(threads)
-
-    plate_end_time = time.time()
-    plate_elapsed_time = plate_end_time - plate_start_time
-
-    log.info("Plate - Purge complete.")
-    log.info("Plate - Time to complete: %.2f", plate_elapsed_time)
-
-    return 1  # Completed
-
-
-def print_plate_name(to_delete, plates):
+def print_plate_name(to_delete, plate_names):
     """
     Returns the description of a LPoI with a given ID
 
     :param to_delete: The person ID whose name is being searched for in the
 dictionary.
     :type to_delete: str
-    :param persons: A list of PoIs found inside of an organization.
-    :type persons: list
+    :param plate_names: Descriptions of LPoIs in the organization, keyed by
+    license plate.
+    :type plate_names: dict
     :return: Returns the name of the person searched for. Will return if there
 was no name found, as well.
     :rtype: str
     """
-    plate_name = None  # Pre-define
-
-    for plate in plates:
-        if plate.get('license_plate') == to_delete:
-            plate_name = plate.get('description')
-            break  # No need to continue running once found
+    plate_name = plate_names.get(to_delete)
 
     if plate_name:
         return plate_name
@@ -881,43 +864,56 @@ was no name found, as well.
         return "No name provided"
 
 
-def run_plates():
+def run_plates(plates=None):
     """
     Allows the program to be ran if being imported as a module.
 
+    :param plates: LPoIs that were already retrieved from the organization.
+    They are fetched here when not given. Defaults to None.
+    :type plates: list, optional
     :return: Returns the value 1 if the program completed successfully.
     :rtype: int
     """
-    log.info("Retrieving plates")
-    plates = get_plates()
-    log.info("Plates retrieved.")
-
-    # Sort the JSON dictionaries by plate id
-    plates = sorted(plates, key=lambda x: x['license_plate'])
+    if plates is None:
+        log.info("Retrieving plates")
+        plates = get_plates()
+        log.info("Plates retrieved.")
 
     # Run if plates were found
     if plates:
         log.info("Plate - Gather IDs")
-        all_plate_ids = get_plate_ids(plates)
-        all_plate_ids = clean_list(all_plate_ids)
+        all_plate_ids = get_plate_ids(plates)  # Never contains None
         log.info("Plate - IDs aquired.")
 
+        # Build both lookups once so every name/ID resolution is O(1).
+        # Iterating in reverse keeps the first LPoI with a repeated name.
+        plate_names = {
+            plate['license_plate']: plate.get('description')
+            for plate in plates if plate.get('license_plate')
+        }
+        plate_ids = {
+            plate.get('description'): plate['license_plate']
+            for plate in reversed(plates) if plate.get('license_plate')
+        }
+
         safe_plate_ids = []
 
         log.info("Searching for safe plates.")
         # Create the list of safe plates
         for plate in PERSISTENT_PLATES:
-            safe_plate_ids.append(get_plate_id(plate, plates))
+            safe_plate_ids.append(get_plate_id(plate, plate_ids))
         safe_plate_ids = clean_list(safe_plate_ids)
 
         log.info("Safe plates found.")
 
-        # New list that filters plates that are safe
+        # New list that filters plates that are safe, a set keeps each
+        # membership test O(1)
+        safe_plate_set = set(safe_plate_ids)
         plates_to_delete = [
-            plate for plate in all_plate_ids if plate not in safe_plate_ids]
+            plate for plate in all_plate_ids if plate not in safe_plate_set]
 
         if plates_to_delete:
-            check_plates(safe_plate_ids, plates_to_delete, plates)
+            check_plates(safe_plate_ids, plates_to_delete, plate_names)
             return 1  # Completed
 
         else:
@@ -941,38 +937,43 @@ There are no more plates to delete.")
 
 # If the code is being ran directly and not imported.
 if __name__ == "__main__":
+    # Every call would be rejected without credentials, so stop before any
+    # threads are started or retries are slept through
+    if not ORG_ID or not API_KEY:
+        log.critical("Set ORG_ID and API_KEY in the environment or .env.")
+        exit(1)
+
     warn()
 
-    ANSWER = None
-    while ANSWER not in ['y', 'n']:
-        ANSWER = str(input("Would you like to run for PoI?\n(y/n) "))\
+    RUN_POI = None
+    while RUN_POI not in ['y', 'n']:
+        RUN_POI = str(input("Would you like to run for PoI?\n(y/n) "))\
             .strip().lower()
 
-        if ANSWER == 'y':
-            run_people()
-
-            ANSWER = None
-
-            while ANSWER not in ['y', 'n']:
-                ANSWER = str(input("Would you like to run for LPoI?\n(y/n) "))\
-                    .strip().lower()
-
-                if ANSWER == 'y':
-                    run_plates()
-
-                elif ANSWER == 'n':
-                    print("Exiting...")
-
-        elif ANSWER == 'n':
-            ANSWER = None
-
-            while ANSWER not in ['y', 'n']:
-                ANSWER = str(input("Would you like to run for LPoI?\n(y/n) "))\
-                    .strip().lower()
+    RUN_LPOI = None
+    while RUN_LPOI not in ['y', 'n']:
+        RUN_LPOI = str(input("Would you like to run for LPoI?\n(y/n) "))\
+            .strip().lower()
 
-                if ANSWER == 'y':
-                    run_plates()
+    if RUN_POI == 'n' and RUN_LPOI == 'n':
+        print("Why did you run this?")
+        print("Exiting...")
 
-                elif ANSWER == 'n':
-                    print("Why did you run this?")
-                    print("Exiting...")
+    else:
+        # Both fetches are independent network calls, so overlap them. The
+        # confirmations that follow stay sequential to keep prompts readable.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if RUN_POI == 'y':
+                log.info("Retrieving persons")
+                people_future = executor.submit(get_people)
+            if RUN_LPOI == 'y':
+                log.info("Retrieving plates")
+                plates_future = executor.submit(get_plates)
+
+        if RUN_POI == 'y':
+            run_people(people_future.result() or [])
+
+        if RUN_LPOI == 'y':
+            run_plates(plates_future.result() or [])
+        else:
+            print("Exiting...")
@@ -16,6 +16,8 @@ import requests
 from dotenv import load_dotenv
 
 import custom_exceptions
+import interactive
+import sessions
 
 load_dotenv()  # Load credentials file
 
@@ -44,10 +46,25 @@ logging.getLogger("urllib3").setLevel(logging.CRITICAL)
 
 # Set the full name for which plates are to be persistent
 PERSISTENT_PLATES = ["Random"]
+# Joined once for the purge confirmation prompt
+PERSISTENT_PLATES_DISPLAY = ", ".join(PERSISTENT_PLATES)
+
+# Shown once by warn() before anything is deleted
+WARN_BANNER = """\
+-------------------------------
+WARNING!!!
+Please make sure you have changed the persistent plates variable.
+Otherwise all of your plates will be deleted.
+Please double-check spelling, as well!
+-------------------------------"""
 
 PLATE_URL = "https://api.verkada.com/cameras/v1/\
 analytics/lpr/license_plate_of_interest"
 
+# Shared keep-alive pool for every call; 429s are handled by the callers
+SESSION = sessions.make_session(pool_maxsize=32)
+SESSION.headers.update({"accept": "application/json"})
+
 
 ##############################################################################
                                 #  Misc  #
@@ -55,72 +72,21 @@ analytics/lpr/license_plate_of_interest"
 
 
 def check(safe, to_delete, plates):
-    """Checks with the user before continuing with the purge"""
-    trust_level = None  # Pre-define
-    ok = None  # Pre-define
-
-    while trust_level not in ['1', '2', '3']:
-        print("1. Check marked persistent plates against what the \
-application found.")
-        print("2. Check what is marked for deletion by the application.")
-        print("3. Trust the process and blindly move forward.")
-
-        trust_level = str(input('- ')).strip()
-
-        if trust_level == '1':
-            print("-------------------------------")
-            print("Please check that the two lists match: ")
-
-            safe_names = [print_plate_name(plate_id, plates)
-                          for plate_id in safe]
-
-            print(", ".join(safe_names))
-            print("vs")
-            print(", ".join(PERSISTENT_PLATES))
-            print("-------------------------------")
-
-            while ok not in ['y', 'n']:
-                ok = str(input("Do they match?(y/n) ")).strip().lower()
-
-                if ok == 'y':
-                    purge_plates(to_delete, plates)
-
-                elif ok == 'n':
-                    print("Please check the input values")
-                    print("Exiting...")
-
-                else:
-                    print("Invalid input. Please enter 'y' or 'n'.")
-
-        elif trust_level == '2':
-            print("-------------------------------")
-            print("Here are the plates being purged: ")
-
-            delete_names = \
-                [print_plate_name(plate_id, plates) for plate_id in to_delete]
-            print(", ".join(delete_names))
-            print("-------------------------------")
-
-            while ok not in ['y', 'n']:
-                ok = \
-                    str(input("Is this list accurate?(y/n) ")).strip().lower()
-
-                if ok == 'y':
-                    purge_plates(to_delete, plates)
-
-                elif ok == 'n':
-                    print("Please check the input values.")
-                    print("Exiting...")
-
-                else:
-                    print("Invalud input. Please enter 'y' or 'n'.")
-
-        elif trust_level == '3':
-            print("Good luck!")
-            purge_plates(to_delete, plates)
+    """
+    Checks with the user before continuing with the purge.
 
-        else:
-            print("Invalid input. Please enter '1', '2', or '3'.")
+    :param safe: Plates that are marked as safe during the purge.
+    :type safe: list
+    :param to_delete: Plates that are marked to be deleted during the purge.
+    :type to_delete: list
+    :param plates: A list of all plates found in a Verkada organization.
+    :type plates: list
+    """
+    interactive.check_purge(
+        safe, to_delete, plates, PERSISTENT_PLATES_DISPLAY,
+        print_plate_name, purge_plates, "plates",
+        "license_plate", "description"
+    )
 
 
 class RateLimiter:
@@ -202,11 +168,13 @@ def run_thread_with_rate_limit(threads, rate_limit=10):
 
     def run_thread(thread):
         limiter.acquire()
-        log.debug(
-            "Starting thread %s at time %s",
-            thread.name,
-            datetime.datetime.now().strftime('%H:%M:%S')
-        )
+        # Only format the timestamp when debug output will actually be shown
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Starting thread %s at time %s",
+                thread.name,
+                datetime.datetime.now().strftime('%H:%M:%S')
+            )
         thread.start()
 
     for thread in threads:
@@ -218,16 +186,8 @@ def run_thread_with_rate_limit(threads, rate_limit=10):
 
 def warn():
     """Prints a warning message before continuing"""
-    print("-------------------------------")
-    print("WARNING!!!")
-    print("Please make sure you have changed the persistent plates variable.")
-    print("Otherwise all of your plates will be deleted.")
-    print("Please double-check spelling, as well!")
-    print("-------------------------------")
-    cont = None
-
-    while cont not in ["", " "]:
-        cont = str(input("Press enter to continue\n")).strip()
+    print(WARN_BANNER)
+    input("Press enter to continue\n")
 
 
 def clean_list(messy_list):
@@ -259,16 +219,13 @@ def get_plates(org_id=ORG_ID, api_key=API_KEY):
     :return: A List of dictionaries of license plates in an organization.
     :rtype: list
     """
-    headers = {
-        "accept": "application/json",
-        "x-api-key": api_key
-    }
+    headers = {"x-api-key": api_key}
 
     params = {
         "org_id": org_id,
     }
 
-    response = requests.get(
+    response = SESSION.get(
         PLATE_URL,
         headers=headers,
         params=params,
@@ -369,10 +326,7 @@ def delete_plate(plate, plates, org_id=ORG_ID, api_key=API_KEY):
     local_data = threading.local()
     local_data.RETRY_DELAY = DEFAULT_RETRY_DELAY
 
-    headers = {
-        "accept": "application/json",
-        "x-api-key": api_key
-    }
+    headers = {"x-api-key": api_key}
 
     log.info(
         "Running for plate: %s",
@@ -386,7 +340,7 @@ def delete_plate(plate, plates, org_id=ORG_ID, api_key=API_KEY):
 
     try:
         for _ in range(MAX_RETRIES):
-            response = requests.delete(
+            response = SESSION.delete(
                 PLATE_URL,
                 headers=headers,
                 params=params,
@@ -530,8 +484,9 @@ def run_plates():
         log.info("Safe plates found.")
 
         # New list that filters plates that are safe
+        safe_plate_set = set(safe_plate_ids)  # O(1) lookups
         plates_to_delete = [
-            plate for plate in all_plate_ids if plate not in safe_plate_ids]
+            plate for plate in all_plate_ids if plate not in safe_plate_set]
 
         if plates_to_delete:
             check(safe_plate_ids, plates_to_delete, plates)
@@ -16,6 +16,8 @@ import requests
 from dotenv import load_dotenv
 
 import custom_exceptions
+import interactive
+import sessions
 
 load_dotenv()  # Load credentials file
 
@@ -44,9 +46,24 @@ logging.getLogger("urllib3").setLevel(logging.CRITICAL)
 
 # Set the full name for which persons are to be persistent
 PERSISTENT_PERSONS = ["PoI"]
+# Joined once for the purge confirmation prompt
+PERSISTENT_PERSONS_DISPLAY = ", ".join(PERSISTENT_PERSONS)
+
+# Shown once by warn() before anything is deleted
+WARN_BANNER = """\
+-------------------------------
+WARNING!!!
+Please make sure you have changed the persistent persons variable.
+Otherwise all of your persons will be deleted.
+Please double-check spelling, as well!
+-------------------------------"""
 
 PERSON_URL = "https://api.verkada.com/cameras/v1/people/person_of_interest"
 
+# Shared keep-alive pool for every call; 429s are handled by the callers
+SESSION = sessions.make_session(pool_maxsize=32)
+SESSION.headers.update({"accept": "application/json"})
+
 
 ##############################################################################
                                 #  Misc  #
@@ -54,73 +71,21 @@ PERSON_URL = "https://api.verkada.com/cameras/v1/people/person_of_interest"
 
 
 def check(safe, to_delete, persons):
-    """Checks with the user before continuing with the purge"""
-    trust_level = None  # Pre-define
-    ok = None  # Pre-define
-
-    while trust_level not in ['1', '2', '3']:
-        print("1. Check marked persistent persons against what the \
-application found.")
-        print("2. Check what is marked for deletion by the application.")
-        print("3. Trust the process and blindly move forward.")
-
-        trust_level = str(input('- ')).strip()
-
-        if trust_level == '1':
-            print("-------------------------------")
-            print("Please check that the two lists match: ")
-
-            safe_names = [print_person_name(
-                person_id, persons) for person_id in safe]
-
-            print(", ".join(safe_names))
-            print("vs")
-            print(", ".join(PERSISTENT_PERSONS))
-            print("-------------------------------")
-
-            while ok not in ['y', 'n']:
-                ok = str(input("Do they match?(y/n) ")).strip().lower()
-
-                if ok == 'y':
-                    purge_people(to_delete, persons)
-
-                elif ok == 'n':
-                    print("Please check the input values")
-                    print("Exiting...")
-
-                else:
-                    print("Invalid input. Please enter 'y' or 'n'.")
-
-        elif trust_level == '2':
-            print("-------------------------------")
-            print("Here are the persons being purged: ")
-
-            delete_names = \
-                [print_person_name(person_id, persons)
-                 for person_id in to_delete]
-            print(", ".join(delete_names))
-            print("-------------------------------")
-
-            while ok not in ['y', 'n']:
-                ok = \
-                    str(input("Is this list accurate?(y/n) ")).strip().lower()
-
-                if ok == 'y':
-                    purge_people(to_delete, persons)
-
-                elif ok == 'n':
-                    print("Please check the input values.")
-                    print("Exiting...")
-
-                else:
-                    print("Invalud input. Please enter 'y' or 'n'.")
-
-        elif trust_level == '3':
-            print("Good luck!")
-            purge_people(to_delete, persons)
+    """
+    Checks with the user before continuing with the purge.
 
-        else:
-            print("Invalid input. Please enter '1', '2', or '3'.")
+    :param safe: A list of people that are marked as safe.
+    :type safe: list
+    :param to_delete: A list of people to delete during the purge.
+    :type to_delete: list
+    :param persons: A list of all people found in the organization.
+    :type persons: list
+    """
+    interactive.check_purge(
+        safe, to_delete, persons, PERSISTENT_PERSONS_DISPLAY,
+        print_person_name, purge_people, "persons",
+        "person_id", "label"
+    )
 
 
 class RateLimiter:
@@ -202,11 +167,13 @@ def run_thread_with_rate_limit(threads, rate_limit=10):
 
     def run_thread(thread):
         limiter.acquire()
-        log.debug(
-            "Starting thread %s at time %s",
-            thread.name,
-            datetime.datetime.now().strftime('%H:%M:%S')
-        )
+        # Only format the timestamp when debug output will actually be shown
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Starting thread %s at time %s",
+                thread.name,
+                datetime.datetime.now().strftime('%H:%M:%S')
+            )
         thread.start()
 
     for thread in threads:
@@ -218,16 +185,8 @@ def run_thread_with_rate_limit(threads, rate_limit=10):
 
 def warn():
     """Prints a warning message before continuing"""
-    print("-------------------------------")
-    print("WARNING!!!")
-    print("Please make sure you have changed the persistent plates variable.")
-    print("Otherwise all of your plates will be deleted.")
-    print("Please double-check spelling, as well!")
-    print("-------------------------------")
-    cont = None
-
-    while cont not in ["", " "]:
-        cont = str(input("Press enter to continue\n")).strip()
+    print(WARN_BANNER)
+    input("Press enter to continue\n")
 
 
 def clean_list(messy_list):
@@ -248,85 +207,6 @@ def clean_list(messy_list):
 ##############################################################################
 
 
-def check_people(safe, to_delete, persons):
-    """
-    Checks with the user before continuing with the purge.
-
-    :param safe: A list of people that are marked as safe.
-    :type safe: list
-    :param to_delete: A list of people to delete during the purge.
-    :type to_delete: list
-    :param persons: A list of all people found in the organization.
-    :type persons: list
-    """
-    trust_level = None  # Pre-define
-    ok = None  # Pre-define
-
-    while trust_level not in ['1', '2', '3']:
-        print("1. Check marked persistent persons against what the \
-application found.")
-        print("2. Check what is marked for deletion by the application.")
-        print("3. Trust the process and blindly move forward.")
-
-        trust_level = str(input('- ')).strip()
-
-        if trust_level == '1':
-            print("-------------------------------")
-            print("Please check that the two lists match: ")
-
-            safe_names = [print_person_name(person_id, persons)
-                          for person_id in safe]
-
-            print(", ".join(safe_names))
-            print("vs")
-            print(", ".join(PERSISTENT_PERSONS))
-            print("-------------------------------")
-
-            while ok not in ['y', 'n']:
-                ok = str(input("Do they match?(y/n) ")).strip().lower()
-
-                if ok == 'y':
-                    purge_people(to_delete, persons)
-
-                elif ok == 'n':
-                    print("Please check the input values")
-                    print("Exiting...")
-
-                else:
-                    print("Invalid input. Please enter 'y' or 'n'.")
-
-        elif trust_level == '2':
-            print("-------------------------------")
-            print("Here are the persons being purged: ")
-
-            delete_names = \
-                [print_person_name(person_id, persons)
-                 for person_id in to_delete]
-            print(", ".join(delete_names))
-            print("-------------------------------")
-
-            while ok not in ['y', 'n']:
-                ok = \
-                    str(input("Is this list accurate?(y/n) ")).strip().lower()
-
-                if ok == 'y':
-                    purge_people(to_delete, persons)
-
-                elif ok == 'n':
-                    print("Please check the input values.")
-                    print("Exiting...")
-
-                else:
-                    print("Invalud input. Please enter 'y' or 'n'.")
-
-        elif trust_level == '3':
-            print("Good luck!")
-            purge_people(to_delete, persons)
-
-        else:
-            print("Invalid input. Please enter '1', '2', or '3'.")
-
-
 def get_people(org_id=ORG_ID, api_key=API_KEY):
     """
     Returns JSON-formatted persons in a Command org.
@@ -338,16 +218,13 @@ def get_people(org_id=ORG_ID, api_key=API_KEY):
     :return: A List of dictionaries of people in an organization.
     :rtype: list
     """
-    headers = {
-        "accept": "application/json",
-        "x-api-key": api_key
-    }
+    headers = {"x-api-key": api_key}
 
     params = {
         "org_id": org_id,
     }
 
-    response = requests.get(
+    response = SESSION.get(
         PERSON_URL,
         headers=headers,
         params=params,
@@ -443,10 +320,7 @@ def delete_person(person, persons, org_id=ORG_ID, api_key=API_KEY):
     local_data = threading.local()
     local_data.RETRY_DELAY = DEFAULT_RETRY_DELAY
 
-    headers = {
-        "accept": "application/json",
-        "x-api-key": api_key
-    }
+    headers = {"x-api-key": api_key}
 
     log.info("Running for person: %s", print_person_name(person, persons))
 
@@ -457,7 +331,7 @@ def delete_person(person, persons, org_id=ORG_ID, api_key=API_KEY):
 
     try:
         for _ in range(MAX_RETRIES):
-            response = requests.delete(
+            response = SESSION.delete(
                 PERSON_URL,
                 headers=headers,
                 params=params,
@@ -592,12 +466,13 @@ def run_people():
         log.info("Safe persons found.")
 
         # New list that filters persons that are safe
+        safe_person_set = set(safe_person_ids)  # O(1) lookups
         persons_to_delete = [
             person for person in all_person_ids
-            if person not in safe_person_ids]
+            if person not in safe_person_set]
 
         if persons_to_delete:
-            check_people(safe_person_ids, persons_to_delete, persons)
+            check(safe_person_ids, persons_to_delete, persons)
             return 1  # Completed
 
         else:
@@ -9,10 +9,14 @@ import logging
 import os
 import threading
 import time
+from functools import partial
 
 import requests
 from dotenv import load_dotenv
 
+import interactive
+import sessions
+
 load_dotenv()  # Load credentials file
 
 ORG_ID = os.getenv("")
@@ -34,11 +38,26 @@ PERSISTENT_USERS = sorted(["Ian Young", "Bruce Banner",
                            "Jane Doe", "Tony Stark", "Ray Raymond",
                            "John Doe"]
                           )
+# Joined once for the purge confirmation prompt
+PERSISTENT_USERS_DISPLAY = ", ".join(PERSISTENT_USERS)
+
+# Shown once by warn() before anything is deleted
+WARN_BANNER = """\
+-------------------------------
+WARNING!!!
+Please make sure you have changed the persistent users variable.
+Otherwise all of your users will be deleted.
+Please double-check spelling, as well!
+-------------------------------"""
 
 # Set URLS
 USER_INFO_URL = "https://api.verkada.com/access/v1/access_users"
 USER_CONTROL_URL = "https://api.verkada.com/core/v1/user"
 
+# Shared keep-alive pool for every call; 429s are handled by the callers
+SESSION = sessions.make_session(pool_maxsize=32)
+SESSION.headers.update({"accept": "application/json"})
+
 
 ##############################################################################
                                 #  Misc  #
@@ -47,83 +66,28 @@ USER_CONTROL_URL = "https://api.verkada.com/core/v1/user"
 
 def warn():
     """Prints a warning message before continuing"""
-    print("-------------------------------")
-    print("WARNING!!!")
-    print("Please make sure you have changed the persistent users variable.")
-    print("Otherwise all of your users will be deleted.")
-    print("Please double-check spelling, as well!")
-    print("-------------------------------")
-    cont = None
-    while cont not in ["", " "]:
-        cont = input("Press enter to continue\n")
+    print(WARN_BANNER)
+    input("Press enter to continue\n")
 
 
 def check(safe, to_delete, users, manager):
-    """Checks with the user before continuing with the purge"""
-    trust_level = None  # Pre-define
-    ok = None  # Pre-define
-
-    while trust_level not in ['1', '2', '3']:
-        print("1. Check marked persistent users against what the \
-application found.")
-        print("2. Check what is marked for deletion by the application.")
-        print("3. Trust the process and blindly move forward.")
-
-        trust_level = str(input('- ')).strip()
-
-        if trust_level == '1':
-            print("-------------------------------")
-            print("Please check that the two lists match: ")
-
-            safe_names = [print_name(user_id, users) for user_id in safe]
-
-            print(", ".join(safe_names))
-            print("vs")
-            print(", ".join(PERSISTENT_USERS))
-            print("-------------------------------")
-
-            while ok not in ['y', 'n']:
-                ok = str(input("Do they match?(y/n) ")).strip().lower()
-
-                if ok == 'y':
-                    purge(to_delete, users, manager)
-
-                elif ok == 'n':
-                    print("Please check the input values")
-                    print("Exiting...")
-
-                else:
-                    print("Invalid input. Please enter 'y' or 'n'.")
-
-        elif trust_level == '2':
-            print("-------------------------------")
-            print("Here are the users being purged: ")
-
-            delete_names = \
-                [print_name(user_id, users) for user_id in to_delete]
-            print(", ".join(delete_names))
-            print("-------------------------------")
-
-            while ok not in ['y', 'n']:
-                ok = \
-                    str(input("Is this list accurate?(y/n) ")).strip().lower()
-
-                if ok == 'y':
-                    purge(to_delete, users, manager)
-
-                elif ok == 'n':
-                    print("Please check the input values.")
-                    print("Exiting...")
-
-                else:
-                    print("Invalud input. Please enter 'y' or 'n'.")
-
-        elif trust_level == '3':
-            print("Good luck!")
-            purge(to_delete, users, manager)
+    """
+    Checks with the user before continuing with the purge.
 
-        else:
-            print("Invalid input. Please enter '1', '2', or '3'.")
+    :param safe: A list of users that are marked as safe.
+    :type safe: list
+    :param to_delete: A list of users to delete during the purge.
+    :type to_delete: list
+    :param users: A list of all users found in the organization.
+    :type users: list
+    :param manager: Tracks the API calls made during the purge.
+    :type manager: PurgeManager
+    """
+    interactive.check_purge(
+        safe, to_delete, users, PERSISTENT_USERS_DISPLAY, print_name,
+        partial(purge, manager=manager), "users",
+        "user_id", "full_name"
+    )
 
 
 class PurgeManager:
@@ -208,16 +172,13 @@ def get_users(org_id=ORG_ID, api_key=API_KEY):
     :return: A List of dictionaries of users in an organization.
     :rtype: list
     """
-    headers = {
-        "accept": "application/json",
-        "x-api-key": api_key
-    }
+    headers = {"x-api-key": api_key}
 
     params = {
         "org_id": org_id,
     }
 
-    response = requests.get(
+    response = SESSION.get(
         USER_INFO_URL,
         headers=headers,
         params=params,
@@ -307,14 +268,11 @@ def delete_user(user, users, org_id=ORG_ID, api_key=API_KEY):
     # Format the URL
     url = USER_CONTROL_URL + "?user_id=" + user + "&org_id=" + org_id
 
-    headers = {
-        "accept": "application/json",
-        "x-api-key": api_key
-    }
+    headers = {"x-api-key": api_key}
 
     log.info("Running for user: %s", print_name(user, users))
 
-    response = requests.delete(url, headers=headers, timeout=5)
+    response = SESSION.delete(url, headers=headers, timeout=5)
 
     if response.status_code != 200:
         log.error(
@@ -426,8 +384,9 @@ def run():
         log.info("Safe users found.\n")
 
         # New list that filters users that are safe
+        safe_user_set = set(safe_user_ids)  # O(1) lookups
         users_to_delete = [
-            user for user in all_user_ids if user not in safe_user_ids]
+            user for user in all_user_ids if user not in safe_user_set]
 
         if users_to_delete:
             purge_manager = PurgeManager(call_count_limit=300)
@@ -7,10 +7,12 @@ import logging
 from datetime import datetime, timedelta
 from os import getenv
 
+import orjson
 import requests
 from dotenv import load_dotenv
 
 import custom_exceptions
+import sessions
 
 load_dotenv()
 
@@ -66,7 +68,7 @@ def login_and_get_tokens(login_session, username, password, org_id):
         response.raise_for_status()
 
         # Extract relevant information from the JSON response
-        json_response = response.json()
+        json_response = orjson.loads(response.content)
         session_csrf_token = json_response.get("csrfToken")
         session_user_token = json_response.get("userToken")
         session_user_id = json_response.get("userId")
@@ -81,6 +83,7 @@ def login_and_get_tokens(login_session, username, password, org_id):
 def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     """
     Logs the Python script out of Command to prevent orphaned sessions.
+    The session itself is left open; it belongs to the caller.
 
     :param x_verkada_token: The csrf token for a valid, authenticated session.
     :type x_verkada_token: str
@@ -109,9 +112,6 @@ def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     except requests.exceptions.RequestException as e:
         raise custom_exceptions.APIExceptionHandler(e, response, "Logout")
 
-    finally:
-        logout_session.close()
-
 
 def schedule_override(schedule_session, x_verkada_token, x_verkada_auth, usr,
                       org_id, door, time):
@@ -207,7 +207,7 @@ def schedule_override(schedule_session, x_verkada_token, x_verkada_auth, usr,
 
 
 if __name__ == "__main__":
-    with requests.Session() as session:
+    with sessions.make_session() as session:
         try:
             log.debug("Retrieving credentials.")
             csrf_token, user_token, user_id = login_and_get_tokens(
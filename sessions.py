@@ -0,0 +1,48 @@
+"""
+Author: Ian Young
+Purpose: Import into other scripts to share one pooled session setup.
+"""
+# Import essential libraries
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def make_session(pool_maxsize=16, retry=True):
+    """
+    Creates the session used for every call in a run. Its pooled adapter
+    keeps the connection from the login open for the calls that follow,
+    including the logout, so the TLS handshake is only paid once.
+
+    Only idempotent requests (GET, DELETE, etc.) are retried on a 502, 503
+    or 504; POSTs such as the login, logout and door/lockdown actions are
+    sent once. Once the retries are used up the last response is returned
+    as-is, so callers still see it through raise_for_status().
+
+    :param pool_maxsize: How many connections to keep open at once. Set it
+    to at least the number of threads sharing the session.
+    :type pool_maxsize: int, optional
+    :param retry: Whether gateway errors should be retried by the adapter.
+    Scripts that handle every status code themselves pass False.
+    :type retry: bool, optional
+    :return: A session with a pooled HTTPS adapter mounted.
+    :rtype: requests.Session
+    """
+    max_retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False
+    ) if retry else 0
+
+    pooled_session = requests.Session()
+    pooled_session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries
+        )
+    )
+
+    return pooled_session
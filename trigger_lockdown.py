@@ -6,10 +6,12 @@ Purpose: Opens lockdowns both literally and figuratively
 import logging
 from os import getenv
 
+import orjson
 import requests
 from dotenv import load_dotenv
 
 import custom_exceptions
+import sessions
 
 log = logging.getLogger()
 log.setLevel(logging.WARNING)
@@ -71,7 +73,7 @@ def login_and_get_tokens(login_session, username, password, org_id):
         response.raise_for_status()
 
         # Extract relevant information from the JSON response
-        json_response = response.json()
+        json_response = orjson.loads(response.content)
         session_csrf_token = json_response.get("csrfToken")
         session_user_token = json_response.get("userToken")
         session_user_id = json_response.get("userId")
@@ -86,6 +88,7 @@ def login_and_get_tokens(login_session, username, password, org_id):
 def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     """
     Logs the Python script out of Command to prevent orphaned sessions.
+    The session itself is left open; it belongs to the caller.
 
     :param logout_session: The session to use when authenticating.
     :type logout_session: requests.Session
@@ -116,9 +119,6 @@ def logout(logout_session, x_verkada_token, x_verkada_auth, org_id=ORG_ID):
     except requests.exceptions.RequestException as e:
         raise custom_exceptions.APIExceptionHandler(e, response, "Logout")
 
-    finally:
-        logout_session.close()
-
 
 ##############################################################################
                                 #   Requests   #
@@ -193,7 +193,7 @@ def trigger_lockdown(lockdown_session, x_verkada_token, x_verkada_auth, usr,
 
 if __name__ == "__main__":
     try:
-        with requests.Session() as session:
+        with sessions.make_session() as session:
             log.debug("Retrieving credentials.")
             csrf_token, user_token, user_id = login_and_get_tokens(session,
                                                                    USERNAME,
@@ -191,11 +191,13 @@ def run_thread_with_rate_limit(new_threads, rate_limit=5):
 
     def run_thread(thread):
         limiter.acquire()
-        log.debug(
-            "Starting thread %s at time %s",
-            thread.name,
-            datetime.datetime.now().strftime('%H:%M:%S')
-        )
+        # Only format the timestamp when debug output will actually be shown
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Starting thread %s at time %s",
+                thread.name,
+                datetime.now().strftime('%H:%M:%S')
+            )
         thread.start()
 
     for thread in new_threads:
@@ -467,7 +469,7 @@ feca744209047e57&ipo=images', timeout=5)
         log.critical("Failed to download the image")
 
     # Convert the binary content to base64
-    base64_image = base64.b64encode(file_content).decode('utf-8')
+    base64_image = base64.b64encode(file_content).decode('ascii')
 
     # Set payload
     payload = {